@@ -10,7 +10,12 @@ def cmd_triage(args):
 
 def cmd_serve(args):
     from src.server import app
-    app.run(host="127.0.0.1", port=args.port, debug=True)
+    if args.debug:
+        # Werkzeug dev server: auto-reload + debugger, single process
+        app.run(host="127.0.0.1", port=args.port, debug=True)
+        return
+    from waitress import serve
+    serve(app, host="127.0.0.1", port=args.port, threads=args.threads)
 
 
 def cmd_synthesis(args):
@@ -22,18 +27,23 @@ def main():
     parser = argparse.ArgumentParser(prog="wsj-triage", description="WSJ Signal Triage System")
     sub = parser.add_subparsers(dest="command", required=True)
 
-    sub.add_parser("triage", help="Fetch RSS, score articles, generate dashboard")
+    triage_p = sub.add_parser("triage", help="Fetch RSS, score articles, generate dashboard")
+    triage_p.set_defaults(func=cmd_triage)
 
     serve_p = sub.add_parser("serve", help="Start local Flask server for analysis workflow")
     serve_p.add_argument("--port", type=int, default=5050, help="Port (default: 5050)")
+    serve_p.add_argument("--threads", type=int, default=8, help="Waitress worker threads (default: 8)")
+    serve_p.add_argument("--debug", action="store_true", help="Use Flask's debug server instead of waitress")
+    serve_p.set_defaults(func=cmd_serve)
 
     synth_p = sub.add_parser("synthesis", help="Generate weekly memo from analysis log")
     synth_p.add_argument("--days", type=int, default=7, help="Analysis window in days (default: 7)")
+    synth_p.set_defaults(func=cmd_synthesis)
 
-    commands = {"triage": cmd_triage, "serve": cmd_serve, "synthesis": cmd_synthesis}
-
+    # Each handler imports only its own module, so --help and the other
+    # subcommands never pay for Flask / feedparser / jinja2 imports.
     args = parser.parse_args()
-    commands[args.command](args)
+    args.func(args)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,16 @@
-import json
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import List, Optional
 
-from flask import Flask, request, jsonify, make_response, send_file
+try:
+    import fcntl
+except ImportError:  # Windows — O_APPEND alone still keeps each record in one write
+    fcntl = None
+
+import orjson
+from flask import Flask, request, make_response, send_file
 
 log = logging.getLogger(__name__)
 
@@ -14,109 +21,263 @@ LOG_FILE = BASE_DIR / "data" / "analysis_log.jsonl"
 THEMES_FILE = BASE_DIR / "config" / "themes.json"
 TRIAGE_FILE = BASE_DIR / "output" / "triage.html"
 ANALYZE_FILE = BASE_DIR / "templates" / "analyze.html"
+ANALYSES_FILE = BASE_DIR / "templates" / "analyses.html"
+
+# Browser cache lifetime for static pages; revalidated via ETag afterwards
+STATIC_MAX_AGE = 60  # seconds
+
+# /save validation — built once at import, not per request
+TRIAGE_ONLY_FIELDS = frozenset({"triage_decision"})
+
+# Minimal required keys
+REQUIRED_KEYS = ("title", "source", "category", "signal_strength", "time_horizon", "action", "confidence")
+
+# Ordered lists for error messages; frozensets for O(1) membership checks
+VALID_ENUMS = {
+    "category":        ["Policy/Regulatory", "Earnings", "Geopolitics", "Markets", "Structural", "Cyclical", "Narrative/Opinion", "Noise"],
+    "signal_strength": ["High", "Medium", "Low"],
+    "time_horizon":    ["Immediate", "Near-term", "Structural"],
+    "action":          ["Act", "Prepare/Monitor", "No Action"],
+}
+_VALID_ENUM_SETS = {field: frozenset(allowed) for field, allowed in VALID_ENUMS.items()}
+
+# themes.json bytes, re-read only when its (path, mtime, size) changes
+_themes_cache = {"key": None, "body": b""}
 
 # Ensure data directory exists for /save endpoint
 (BASE_DIR / "data").mkdir(parents=True, exist_ok=True)
 
 
-def no_cache(resp):
-    resp.headers["Cache-Control"] = "no-store"
+def ojson(data, status: int = 200):
+    """JSON response serialized with orjson instead of Flask's stdlib-backed jsonify."""
+    return app.response_class(
+        orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype="application/json",
+    )
+
+
+def index_path_for(log_path: Path) -> Path:
+    """Sidecar offset index: one 8-byte little-endian start offset per record."""
+    return log_path.with_suffix(".idx")
+
+
+def append_jsonl(path: Path, obj, index_path: Optional[Path] = None) -> None:
+    """
+    Append one record as a single O_APPEND write, under an exclusive flock
+    where available, so concurrent workers can't interleave partial lines.
+    If `index_path` is given, the record's start offset is appended to it
+    under the same lock.
+
+    The fd is opened per call rather than cached: the log is a hand-managed
+    flat file, and a long-lived fd would keep writing to an unlinked inode
+    if someone moved or replaced it while the server runs.
+    """
+    payload = orjson.dumps(obj) + b"\n"
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        offset = os.lseek(fd, 0, os.SEEK_END)
+        os.write(fd, payload)
+        if index_path is not None:
+            idx_fd = os.open(index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(idx_fd, offset.to_bytes(8, "little"))
+            finally:
+                os.close(idx_fd)
+    finally:
+        os.close(fd)  # also releases the flock
+
+
+def read_log_line(line: bytes) -> Optional[dict]:
+    """One log line as a dict, or None for blanks, narrative text and non-objects (as in synthesis)."""
+    if not line.lstrip().startswith(b"{"):
+        return None
+    try:
+        obj = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def tail_jsonl(path: Path, index_path: Path, limit: int) -> Optional[List[dict]]:
+    """
+    Last `limit` records (oldest first) read via the offset index — O(limit),
+    not O(log size). Returns None when the index is missing or no longer
+    matches the log (e.g. the log was hand-edited), so callers can fall back
+    to a full scan.
+    """
+    try:
+        idx_size = index_path.stat().st_size
+    except FileNotFoundError:
+        return None
+    if idx_size % 8:
+        return None
+    n = min(limit, idx_size // 8)
+    with index_path.open("rb") as f:
+        f.seek(idx_size - 8 * n)
+        raw = f.read(8 * n)
+    offsets = [int.from_bytes(raw[i:i + 8], "little") for i in range(0, len(raw), 8)]
+    # Fewer indexed records than asked for is only complete if the index starts at byte 0
+    if n < limit and (not offsets or offsets[0] != 0):
+        return None
+
+    items: List[dict] = []
+    with path.open("rb") as f:
+        for off in offsets:
+            f.seek(off)
+            try:
+                obj = orjson.loads(f.readline())
+            except orjson.JSONDecodeError:
+                return None
+            if not isinstance(obj, dict):
+                return None
+            items.append(obj)
+        # The last indexed record must end exactly at EOF, else the log was changed outside /save
+        if offsets and f.tell() != os.fstat(f.fileno()).st_size:
+            return None
+    return items
+
+
+def _etag(st: os.stat_result) -> str:
+    """Weak validator from (mtime, size) — a stat call, no read or hash of the body."""
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
+def _fresh_gzip(path: Path, st: os.stat_result) -> Optional[Path]:
+    """The pre-compressed `<name>.gz` sibling, if present and not older than `path`."""
+    gz = path.with_name(path.name + ".gz")
+    try:
+        return gz if gz.stat().st_mtime_ns >= st.st_mtime_ns else None
+    except FileNotFoundError:
+        return None
+
+
+def send_cached(path: Path, mimetype: str):
+    """
+    Serve a static file with a weak ETag. A matching If-None-Match gets an
+    empty 304 so browser reloads don't re-transfer the body.
+
+    If the generator left a fresh `<name>.gz` next to the file and the client
+    accepts gzip, that is sent as-is with Content-Encoding: gzip — no
+    per-request compression.
+
+    The response is returned straight from send_file (no make_response wrap)
+    so the WSGI server's wsgi.file_wrapper / sendfile path stays available.
+    """
+    st = path.stat()
+    gz = _fresh_gzip(path, st)
+    use_gzip = gz is not None and request.accept_encodings.quality("gzip") > 0
+    tag = _etag(st) + ("-gz" if use_gzip else "")
+    if request.if_none_match.contains_weak(tag):
+        resp = make_response("", 304)
+        resp.cache_control.public = True
+        resp.cache_control.max_age = STATIC_MAX_AGE
+    else:
+        resp = send_file(
+            gz if use_gzip else path,
+            mimetype=mimetype,
+            conditional=True,
+            etag=False,
+            last_modified=st.st_mtime,
+            max_age=STATIC_MAX_AGE,
+        )
+        if use_gzip:
+            resp.content_encoding = "gzip"
+    if gz is not None:
+        resp.vary.add("Accept-Encoding")
+    resp.set_etag(tag, weak=True)
     return resp
 
 
 @app.get("/")
 def home():
-    resp = make_response(send_file(TRIAGE_FILE, mimetype="text/html"))
-    return no_cache(resp)
+    return send_cached(TRIAGE_FILE, "text/html")
 
 
 @app.get("/analyze")
 def analyze():
-    resp = make_response(send_file(ANALYZE_FILE, mimetype="text/html"))
-    resp.headers["Content-Type"] = "text/html; charset=utf-8"
-    resp.headers["Cache-Control"] = "no-store"
-    return resp
+    return send_cached(ANALYZE_FILE, "text/html")
 
 
 @app.get("/themes")
 def themes():
-    if THEMES_FILE.exists():
-        resp = make_response(send_file(THEMES_FILE, mimetype="application/json"))
-        return no_cache(resp)
-    return jsonify({"active_themes": []})
+    if not THEMES_FILE.exists():
+        return ojson({"active_themes": []})
+    st = THEMES_FILE.stat()
+    tag = _etag(st)
+    key = (THEMES_FILE, tag)
+    if _themes_cache["key"] != key:
+        _themes_cache.update(key=key, body=THEMES_FILE.read_bytes())
+    resp = app.response_class(_themes_cache["body"], mimetype="application/json")
+    resp.set_etag(tag, weak=True)
+    resp.last_modified = st.st_mtime
+    resp.cache_control.public = True
+    resp.cache_control.max_age = STATIC_MAX_AGE
+    return resp.make_conditional(request)
 
 
 @app.post("/save")
 def save():
     try:
-        obj = request.get_json(force=True)
-    except Exception:
-        return jsonify({"ok": False, "error": "Invalid JSON"}), 400
+        obj = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return ojson({"ok": False, "error": "Invalid JSON"}, 400)
 
     if not isinstance(obj, dict):
-        return jsonify({"ok": False, "error": "Payload must be a JSON object"}), 400
+        return ojson({"ok": False, "error": "Payload must be a JSON object"}, 400)
 
     # Reject triage-only fields — schema bleed prevention.
     # triage_decision belongs only in the triage pipeline; analysis payloads use 'action'.
-    TRIAGE_ONLY_FIELDS = {"triage_decision"}
-    leaked = [k for k in obj if k in TRIAGE_ONLY_FIELDS]
-    if leaked:
-        return jsonify({
+    if obj.keys() & TRIAGE_ONLY_FIELDS:
+        return ojson({
             "ok": False,
             "error": f"triage_decision is a triage-only field and must not appear in analysis payloads. Use 'action' instead.",
-        }), 400
+        }, 400)
 
-    # Minimal required keys
-    required = ["title", "source", "category", "signal_strength", "time_horizon", "action", "confidence"]
-    missing = [k for k in required if k not in obj]
+    missing = [k for k in REQUIRED_KEYS if k not in obj]
     if missing:
-        return jsonify({"ok": False, "error": f"Missing keys: {missing}"}), 400
+        return ojson({"ok": False, "error": f"Missing keys: {missing}"}, 400)
 
     # Validate enum fields — error messages include the full set of allowed values
-    VALID_ENUMS = {
-        "category":        ["Policy/Regulatory", "Earnings", "Geopolitics", "Markets", "Structural", "Cyclical", "Narrative/Opinion", "Noise"],
-        "signal_strength": ["High", "Medium", "Low"],
-        "time_horizon":    ["Immediate", "Near-term", "Structural"],
-        "action":          ["Act", "Prepare/Monitor", "No Action"],
-    }
-    for field, allowed in VALID_ENUMS.items():
+    for field, allowed in _VALID_ENUM_SETS.items():
         val = obj.get(field)
-        if val not in allowed:
-            return jsonify({"ok": False, "error": f"Invalid {field}: {val!r}. Allowed values: {allowed}"}), 400
+        if not isinstance(val, str) or val not in allowed:
+            return ojson({"ok": False, "error": f"Invalid {field}: {val!r}. Allowed values: {VALID_ENUMS[field]}"}, 400)
 
     obj["server_received_at"] = datetime.now(timezone.utc).isoformat()
 
-    with LOG_FILE.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    append_jsonl(LOG_FILE, obj, index_path_for(LOG_FILE))
 
     log.info("Saved analysis: %s", obj.get("title", "(untitled)"))
-    return jsonify({"ok": True})
+    return ojson({"ok": True})
 
 
 @app.get("/analyses")
 def analyses():
-    ANALYSES_FILE = BASE_DIR / "templates" / "analyses.html"
-    resp = make_response(send_file(ANALYSES_FILE, mimetype="text/html"))
-    resp.headers["Content-Type"] = "text/html; charset=utf-8"
-    resp.headers["Cache-Control"] = "no-store"
-    return resp
+    return send_cached(ANALYSES_FILE, "text/html")
 
 
 @app.get("/api/analyses")
 def api_analyses():
+    # ?limit=N returns only the N most recent entries (still oldest first)
+    limit = request.args.get("limit", type=int)
+    if limit is not None and limit > 0 and LOG_FILE.exists():
+        tail = tail_jsonl(LOG_FILE, index_path_for(LOG_FILE), limit)
+        if tail is not None:
+            return ojson(tail)
+
     items = []
     if LOG_FILE.exists():
-        for line in LOG_FILE.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-                if isinstance(obj, dict):
+        with LOG_FILE.open("rb") as f:
+            for line in f:
+                obj = read_log_line(line)
+                if obj is not None:
                     items.append(obj)
-            except Exception:
-                continue
-    return jsonify(items)
+    if limit is not None and limit > 0:
+        items = items[-limit:]
+    return ojson(items)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
-import argparse
-import html
-import json
 import logging
+import os
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from collections import Counter
+from functools import lru_cache
+from itertools import chain
+
+import orjson
 
 log = logging.getLogger(__name__)
 
@@ -15,24 +17,41 @@ THEMES = BASE_DIR / "config" / "themes.json"
 OUT_MD   = BASE_DIR / "output" / "weekly_memo.md"
 OUT_HTML = BASE_DIR / "output" / "weekly_memo.html"
 
+# How far before the window the newest-first log scan keeps reading
+RECEIVED_SLACK = timedelta(days=1)
+
 
 def parse_dt(s: str):
-    if not s:
+    if not s or not isinstance(s, str):
         return None
+    return _parse_dt_cached(s)
+
+
+@lru_cache(maxsize=4096)
+def _parse_dt_cached(s: str):
+    """Many entries share timestamps (and both pick_event_time fields), so memoize."""
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
     try:
-        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except Exception:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
         return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
 
 
 def load_themes():
     if not THEMES.exists():
         return {"active_themes": []}
+    return _load_themes_cached(THEMES, THEMES.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_themes_cached(path: Path, mtime_ns: int):
+    """Parse themes.json once per mtime; edits to the file invalidate the entry."""
     try:
-        obj = json.loads(THEMES.read_text(encoding="utf-8"))
+        obj = orjson.loads(path.read_bytes())
         if isinstance(obj, dict):
             return obj
     except Exception:
@@ -40,36 +59,115 @@ def load_themes():
     return {"active_themes": []}
 
 
-def load_analysis_objects(path: Path):
+def iter_analysis_objects(path: Path):
     """
-    Reads analysis_log.jsonl returning a list of dict entries.
+    Yield dict entries from analysis_log.jsonl one at a time.
 
     The file must be compact JSON Lines (one JSON object per line), which is
     what server.py /save produces. Non-JSON lines (narrative text, blank lines,
     comments) are silently skipped — no rfind hacks.
+
+    Read line-by-line from a binary handle so only one line is held in
+    memory at a time; orjson parses the bytes directly.
     """
-    items = []
     if not path.exists():
-        return items
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-            if isinstance(obj, dict):
-                items.append(obj)
-        except json.JSONDecodeError:
-            pass  # skip narrative text, malformed lines
-    return items
+        return
+    with path.open("rb") as f:
+        for line in f:
+            obj = parse_log_line(line)
+            if obj is not None:
+                yield obj
+
+
+def parse_log_line(line: bytes):
+    """One analysis-log line as a dict, or None for blanks, narrative text and non-objects."""
+    # Only lines that open an object can parse to a dict; testing the first
+    # byte skips blanks and narrative text without raising a decode error.
+    # lstrip() is only paid for the rare indented line.
+    if not line.startswith(b"{") and not line.lstrip().startswith(b"{"):
+        return None
+    try:
+        obj = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None  # skip narrative text, malformed lines
+    return obj if isinstance(obj, dict) else None
+
+
+def iter_analysis_objects_reversed(path: Path, chunk_size: int = 1 << 16):
+    """
+    Like iter_analysis_objects, but newest (last) line first.
+
+    Reads the file backwards in fixed-size chunks, so a caller that only
+    wants recent entries can stop early without reading the rest of the log.
+    """
+    if not path.exists():
+        return
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            tail = lines[0]  # may be a partial line; completed by the next chunk
+            for line in reversed(lines[1:]):
+                obj = parse_log_line(line)
+                if obj is not None:
+                    yield obj
+        obj = parse_log_line(tail)
+        if obj is not None:
+            yield obj
+
+
+def load_analysis_objects(path: Path):
+    """Reads analysis_log.jsonl returning a list of dict entries."""
+    return list(iter_analysis_objects(path))
 
 
 def pick_event_time(a: dict):
-    return parse_dt(a.get("published_at", "")) or parse_dt(a.get("created_at", ""))
+    return parse_dt(a.get("published_at")) or parse_dt(a.get("created_at"))
+
+
+# Same replacements as html.escape(quote=True), applied in one C-level pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
 
 
 def escape_html(s: str) -> str:
-    return html.escape(s or "")
+    return s.translate(_HTML_ESCAPE_TABLE) if s else ""
+
+
+# Static page shell for the memo — plain strings, so the CSS isn't re-run
+# through f-string formatting on every render
+_MEMO_HTML_HEAD = """<!doctype html>
+<html>
+<head>
+<meta charset="utf-8"/>
+<meta name="viewport" content="width=device-width, initial-scale=1"/>
+<title>Weekly WSJ Signal Memo</title>
+<style>
+  body { font-family: -apple-system, system-ui, Arial; margin: 24px; line-height: 1.4; }
+  h1 { font-size: 22px; margin: 0 0 14px; }
+  h2 { font-size: 16px; margin: 18px 0 8px; }
+  h3 { font-size: 14px; margin: 14px 0 6px; }
+  p, li { font-size: 13px; }
+  code { background: rgba(0,0,0,.06); padding: 2px 6px; border-radius: 6px; }
+  ul { margin: 6px 0 10px 18px; }
+</style>
+</head>
+<body>
+"""
+
+_MEMO_HTML_TAIL = """
+</body>
+</html>
+"""
 
 
 def md_to_basic_html(md_text: str) -> str:
@@ -79,8 +177,11 @@ def md_to_basic_html(md_text: str) -> str:
     - bullet lists starting with "- "
     - paragraphs
     Intentionally simple (no external deps).
+
+    The whole text is escaped once up front; none of the structural
+    prefixes contain escapable characters, so the line pass is unaffected.
     """
-    lines = md_text.splitlines()
+    lines = escape_html(md_text).splitlines()
     html_lines = []
     in_ul = False
 
@@ -99,51 +200,54 @@ def md_to_basic_html(md_text: str) -> str:
 
         if raw.startswith("### "):
             close_ul()
-            html_lines.append(f"<h3>{escape_html(raw[4:])}</h3>")
+            html_lines.append(f"<h3>{raw[4:]}</h3>")
             continue
         if raw.startswith("## "):
             close_ul()
-            html_lines.append(f"<h2>{escape_html(raw[3:])}</h2>")
+            html_lines.append(f"<h2>{raw[3:]}</h2>")
             continue
         if raw.startswith("# "):
             close_ul()
-            html_lines.append(f"<h1>{escape_html(raw[2:])}</h1>")
+            html_lines.append(f"<h1>{raw[2:]}</h1>")
             continue
 
         if raw.startswith("- "):
             if not in_ul:
                 html_lines.append("<ul>")
                 in_ul = True
-            html_lines.append(f"<li>{escape_html(raw[2:])}</li>")
+            html_lines.append(f"<li>{raw[2:]}</li>")
             continue
 
         # default paragraph
         close_ul()
-        html_lines.append(f"<p>{escape_html(raw)}</p>")
+        html_lines.append(f"<p>{raw}</p>")
 
     close_ul()
 
-    return f"""<!doctype html>
-<html>
-<head>
-<meta charset="utf-8"/>
-<meta name="viewport" content="width=device-width, initial-scale=1"/>
-<title>Weekly WSJ Signal Memo</title>
-<style>
-  body {{ font-family: -apple-system, system-ui, Arial; margin: 24px; line-height: 1.4; }}
-  h1 {{ font-size: 22px; margin: 0 0 14px; }}
-  h2 {{ font-size: 16px; margin: 18px 0 8px; }}
-  h3 {{ font-size: 14px; margin: 14px 0 6px; }}
-  p, li {{ font-size: 13px; }}
-  code {{ background: rgba(0,0,0,.06); padding: 2px 6px; border-radius: 6px; }}
-  ul {{ margin: 6px 0 10px 18px; }}
-</style>
-</head>
-<body>
-{''.join(html_lines)}
-</body>
-</html>
-"""
+    return _MEMO_HTML_HEAD + "".join(html_lines) + _MEMO_HTML_TAIL
+
+
+def recent_analyses(path: Path, since: datetime):
+    """
+    (event time, entry) pairs with event time >= since, oldest first.
+
+    Walks the log newest-first and stops after the first entry /save stamped
+    well before the window. /save appends in arrival order, so everything
+    above it is older still; the slack covers client clocks running ahead of
+    the server. Legacy entries without server_received_at never stop the scan.
+    """
+    stop_before = since - RECEIVED_SLACK
+    recent = []
+    for a in iter_analysis_objects_reversed(path):
+        dt = pick_event_time(a)
+        if dt and dt >= since:
+            recent.append((dt, a))
+        received = parse_dt(a.get("server_received_at"))
+        if received and received < stop_before:
+            break
+    recent.reverse()  # back to file order, so equal timestamps keep their order
+    recent.sort(key=lambda x: x[0])
+    return recent
 
 
 def main(days: int = 7):
@@ -156,21 +260,14 @@ def main(days: int = 7):
     now      = datetime.now(timezone.utc)
     week_ago = now - timedelta(days=days)
 
-    analyses = load_analysis_objects(LOG)
-
-    # Filter to the requested window
-    recent = []
-    for a in analyses:
-        dt = pick_event_time(a)
-        if dt and dt >= week_ago:
-            recent.append((dt, a))
-    recent.sort(key=lambda x: x[0])
+    recent = recent_analyses(LOG, week_ago)
 
     themes = load_themes().get("active_themes", [])
 
-    reinforce  = Counter()
-    contradict = Counter()
-    tags       = Counter()
+    # Flat key lists, counted once after the loop
+    all_reinforce:  list = []
+    all_contradict: list = []
+    all_tags:       list = []
 
     # Stance-change tracking (monotonic escalation vs flip-flop — caller interprets)
     stance_changes: list = []
@@ -181,37 +278,47 @@ def main(days: int = 7):
     # Collect Act items for the top-of-memo callout
     act_items: list = []
 
-    for dt, a in recent:
-        for t in (a.get("tags", []) or []):
-            tags[str(t)] += 1
-
-        for th in (a.get("reinforces", []) or []):
-            reinforce[str(th)] += 1
-
-        for th in (a.get("contradicts", []) or []):
-            contradict[str(th)] += 1
+    # Bound methods hoisted out of the loop
+    tags_extend       = all_tags.extend
+    reinforce_extend  = all_reinforce.extend
+    contradict_extend = all_contradict.extend
+    stance_append     = stance_changes.append
+    last_action_get   = last_action_by_key.get
 
-        keys: list = []
-        keys.extend([str(x) for x in (a.get("reinforces", []) or []) if x])
-        keys.extend([str(x) for x in (a.get("tags", []) or []) if x])
-
-        for key in keys:
-            prev = last_action_by_key.get(key)
-            curr = a.get("action")
-            if prev and curr and prev != curr:
-                stance_changes.append((dt.isoformat(), key, prev, curr, a.get("title", "")))
-            if curr:
+    for dt, a in recent:
+        ts = dt.isoformat()  # formatted once per entry, shared by every record below
+
+        # Stringify each field once; the same lists feed the counters and the stance keys.
+        # Empty/falsy entries are dropped everywhere (the stance keys already ignored them).
+        r_keys = [str(x) for x in (a.get("reinforces") or ()) if x]
+        t_keys = [str(x) for x in (a.get("tags") or ()) if x]
+
+        tags_extend(t_keys)
+        reinforce_extend(r_keys)
+        contradict_extend([str(x) for x in (a.get("contradicts") or ()) if x])
+
+        curr = a.get("action")
+        if curr:
+            for key in chain(r_keys, t_keys):
+                prev = last_action_get(key)
+                if prev and prev != curr:
+                    stance_append((ts, key, prev, curr, a.get("title", "")))
                 last_action_by_key[key] = curr
 
         if a.get("updates_confidence"):
-            confidence_changes.append((dt.isoformat(), str(a.get("updates_confidence")), a.get("title", "")))
+            confidence_changes.append((ts, str(a.get("updates_confidence")), a.get("title", "")))
 
-        if a.get("action") == "Act":
-            act_items.append((dt, a))
+        if curr == "Act":
+            act_items.append((dt, ts, a))
+
+    # One C-level counting pass per field instead of a Counter.update per entry
+    reinforce  = Counter(all_reinforce)
+    contradict = Counter(all_contradict)
+    tags       = Counter(all_tags)
 
     # Sort Act items: most recent first, then highest confidence within same timestamp
     act_items.sort(
-        key=lambda x: (x[0], int(x[1].get("confidence", 0) or 0)),
+        key=lambda x: (x[0], int(x[2].get("confidence", 0) or 0)),
         reverse=True,
     )
 
@@ -224,8 +331,8 @@ def main(days: int = 7):
     # ── Act items — first, most urgent ───────────────────────────────────────
     lines.append("## Act items\n")
     if act_items:
-        for dt, a in act_items:
-            lines.append(f"- {dt.isoformat()} — **{a.get('title', '')}** ({a.get('category', '')})")
+        for _, ts, a in act_items:
+            lines.append(f"- {ts} — **{a.get('title', '')}** ({a.get('category', '')})")
             for trigger in (a.get("action_triggers", []) or []):
                 lines.append(f"  - Trigger: {trigger}")
     else:
@@ -286,6 +393,8 @@ def main(days: int = 7):
 
 
 if __name__ == "__main__":
+    import argparse  # only needed when run as a script; run.py has its own parser
+
     parser = argparse.ArgumentParser(description="Generate WSJ Signal weekly memo")
     parser.add_argument("--days", type=int, default=7, help="Analysis window in days (default: 7)")
     args = parser.parse_args()
@@ -1,17 +1,23 @@
+import gzip
+import hashlib
 import html as html_module
 import logging
 import os
 import re
-import json
+import ssl
 import urllib.request
 import urllib.error
 import feedparser
+import orjson
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from dateutil import parser as dateparser
 from jinja2 import Template
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any, List
+from typing import Optional, Tuple, Dict, Any, List, FrozenSet
 
 log = logging.getLogger(__name__)
 
@@ -42,10 +48,14 @@ CATEGORY_WINDOW_HOURS = {
     "Noise": 48,
 }
 
+# Widest recency window any item can get; entries older than this are never shown
+MAX_WINDOW_HOURS = max(RECENT_HOURS, *CATEGORY_WINDOW_HOURS.values())
+
 RUN_STATE_FILE = BASE_DIR / "data" / "run_state.json"
 URL_AGE_FILE   = BASE_DIR / "data" / "url_first_seen.json"
 THEMES_FILE    = BASE_DIR / "config" / "themes.json"
 SCORING_FILE   = BASE_DIR / "config" / "scoring.json"
+FEED_CACHE_DIR = BASE_DIR / "data" / "feed_cache"  # last full response per feed, replayed on 304
 
 EVERGREEN_DAYS = 90
 URL_PRUNE_DAYS = 180
@@ -53,11 +63,20 @@ URL_PRUNE_DAYS = 180
 # Per-request feed fetch timeout — does NOT touch global socket state
 FEED_TIMEOUT = 15  # seconds
 
+# Feeds are fetched concurrently; each fetch is network-bound
+MAX_FEED_WORKERS = 8
+
+# One opener / SSL context for all fetches, so CA certs are loaded once per
+# run rather than once per urlopen call
+_FEED_OPENER = urllib.request.build_opener(
+    urllib.request.HTTPSHandler(context=ssl.create_default_context())
+)
+
 # Load scoring thresholds from config (tunable without code edits).
 # If the file is missing or invalid, fall back to defaults and warn loudly.
 _SCORING_CFG_VALID = True
 try:
-    _scoring_cfg: Dict[str, Any] = json.loads(SCORING_FILE.read_text(encoding="utf-8"))
+    _scoring_cfg: Dict[str, Any] = orjson.loads(SCORING_FILE.read_bytes())
 except Exception:
     _scoring_cfg = {}
     _SCORING_CFG_VALID = False
@@ -71,48 +90,116 @@ MEDIUM_THRESHOLD: int = int(_scoring_cfg.get("medium_threshold", 45))
 # Regex / Rules (light heuristics)
 # =========================
 
-NUMERIC = re.compile(r"\b(\d+(\.\d+)?%?|\$\d+|\d{4}|\bQ[1-4]\b)\b", re.I)
+# Negated class instead of lazy ".*?": linear scan, no backtracking, and
+# tags whose attributes wrap onto a new line are still matched
+HTML_TAG = re.compile(r"<[^>]*>")
+
+# All rule patterns below are written in lowercase and compiled without re.I:
+# callers match them against text lowercased once per item, which is cheaper
+# than case-folding inside the regex engine for every pattern.
+
+NUMERIC = re.compile(r"\b(\d+(\.\d+)?%?|\$\d+|\d{4}|\bq[1-4]\b)\b")
 
 CATEGORY_RULES = [
-    ("Policy/Regulatory", re.compile(r"\b(Fed|FOMC|Treasury|SEC|DOJ|FTC|regulat|rule|ban|tariff|sanction|bill|law|court|ruling|order)\b", re.I)),
-    ("Earnings",          re.compile(r"\b(earnings|guidance|EPS|revenue|profit|margin|10-?K|10-?Q|filing)\b", re.I)),
-    ("Geopolitics",       re.compile(r"\b(Iran|China|Russia|Ukraine|Israel|Gaza|Taiwan|NATO|war|conflict)\b", re.I)),
-    ("Markets",           re.compile(r"\b(yield|bond|rates|credit spread|dollar|FX|oil|WTI|Brent|copper|gold|equities|S&P|Nasdaq)\b", re.I)),
-    ("Structural",        re.compile(r"\b(capacity|supply chain|shortage|grid|electricity|data center|chip|semiconductor|copper|memory|HBM)\b", re.I)),
+    ("Policy/Regulatory", re.compile(r"\b(fed|fomc|treasury|sec|doj|ftc|regulat|rule|ban|tariff|sanction|bill|law|court|ruling|order)\b")),
+    ("Earnings",          re.compile(r"\b(earnings|guidance|eps|revenue|profit|margin|10-?k|10-?q|filing)\b")),
+    ("Geopolitics",       re.compile(r"\b(iran|china|russia|ukraine|israel|gaza|taiwan|nato|war|conflict)\b")),
+    ("Markets",           re.compile(r"\b(yield|bond|rates|credit spread|dollar|fx|oil|wti|brent|copper|gold|equities|s&p|nasdaq)\b")),
+    ("Structural",        re.compile(r"\b(capacity|supply chain|shortage|grid|electricity|data center|chip|semiconductor|copper|memory|hbm)\b")),
 ]
 
+# Categories that earn the "concrete" score bump.
+CONCRETE_CATEGORIES = frozenset({"Policy/Regulatory", "Earnings", "Structural"})
+
+# Default time horizon per category when no text cue overrides it (else Near-term).
+CATEGORY_HORIZON = {
+    "Earnings":          "Immediate",
+    "Markets":           "Immediate",
+    "Policy/Regulatory": "Immediate",
+    "Structural":        "Structural",
+}
+
 FRAMING_TERMS = re.compile(
     r"\b(opinion|column|what it means|explainer|why\b|how to|guide)\b",
-    re.I,
 )
 
 MODAL_TERMS = re.compile(
     r"\b(could|might|may|risk|risks|fears|worries)\b",
-    re.I,
 )
 
 LOW_SIGNAL_MARKET_MOVE = re.compile(
     r"\b(stocks (rose|fell)|shares (rose|fell)|market (rallied|slid))\b",
-    re.I,
 )
 
 # Time horizon text cues.
 # These override the category default only when a "strong" signal phrase is present.
 # Deliberately narrow — "long-term" alone or "over the next year" are too common to be reliable.
 IMMEDIATE_CUES = re.compile(
-    r"\b(this quarter|Q[1-4] results|missed estimates|beat estimates|earnings beat|"
-    r"earnings miss|guidance cut|guidance raised|EPS cut|raised guidance|lowered guidance|"
+    r"\b(this quarter|q[1-4] results|missed estimates|beat estimates|earnings beat|"
+    r"earnings miss|guidance cut|guidance raised|eps cut|raised guidance|lowered guidance|"
     r"reported (earnings|results))\b",
-    re.I,
 )
 
 STRUCTURAL_CUES = re.compile(
     r"\b(multi.year|secular trend|secular shift|long.term trend|structural shift|"
     r"permanent change|irreversible|decade.long|generational (shift|change))\b",
-    re.I,
 )
 
 
+# Scoring / horizon cues, longest multi-word phrases first. Order matters for
+# the combined scan below: at a given position the first alternative wins, so
+# "Q3 results" must be tried (IMMEDIATE) before the bare "Q3" (NUMERIC).
+SIGNAL_RULES = [
+    ("immediate",   IMMEDIATE_CUES),
+    ("structural",  STRUCTURAL_CUES),
+    ("market_move", LOW_SIGNAL_MARKET_MOVE),
+    ("framing",     FRAMING_TERMS),
+    ("modal",       MODAL_TERMS),
+    ("numeric",     NUMERIC),
+]
+
+
+def _combine(rules) -> "re.Pattern[str]":
+    """One alternation over all rule patterns, so an item's text is scanned once."""
+    return re.compile("|".join(f"(?:{rx.pattern})" for _, rx in rules))
+
+
+CATEGORY_SCAN = _combine(CATEGORY_RULES)
+SIGNAL_SCAN   = _combine(SIGNAL_RULES)
+
+
+# A scan match is one token ("copper", "q3 results", …). Which rules it
+# satisfies is looked up by re-testing the short token against each rule,
+# rather than via lastgroup: a token can belong to several rules ("copper" is
+# both Markets and Structural; "q3 results" is both immediate and numeric).
+@lru_cache(maxsize=4096)
+def _category_token_hits(token: str) -> Tuple[str, ...]:
+    return tuple(cat for cat, rx in CATEGORY_RULES if rx.search(token))
+
+
+@lru_cache(maxsize=4096)
+def _signal_token_hits(token: str) -> Tuple[str, ...]:
+    return tuple(name for name, rx in SIGNAL_RULES if rx.search(token))
+
+
+@lru_cache(maxsize=4096)
+def category_hits(text_lower: str) -> FrozenSet[str]:
+    """Names of all CATEGORY_RULES matching anywhere in (lowercased) text, in a single regex pass."""
+    hits = set()
+    for m in CATEGORY_SCAN.finditer(text_lower):
+        hits.update(_category_token_hits(m.group()))
+    return frozenset(hits)
+
+
+@lru_cache(maxsize=4096)
+def signal_hits(text_lower: str) -> FrozenSet[str]:
+    """Names of all SIGNAL_RULES matching anywhere in (lowercased) text, in a single regex pass."""
+    hits = set()
+    for m in SIGNAL_SCAN.finditer(text_lower):
+        hits.update(_signal_token_hits(m.group()))
+    return frozenset(hits)
+
+
 # =========================
 # Helpers
 # =========================
@@ -127,43 +214,85 @@ def utc_now_iso() -> str:
 
 def strip_html(text: str) -> str:
     """Remove HTML tags and decode entities."""
-    cleaned = re.sub("<.*?>", "", text or "").strip()
+    text = text or ""
+    # Plain-text summaries are common; a C-level containment test skips the regex
+    cleaned = (HTML_TAG.sub("", text) if "<" in text else text).strip()
     return html_module.unescape(cleaned)
 
 
-def parse_rss_published_iso(entry) -> str:
-    for key in ("published", "updated", "created"):
-        val = entry.get(key)
-        if val:
+def parse_dt(s: str) -> Optional[datetime]:
+    """
+    Parse a timestamp to an aware datetime (naive is taken as UTC), or None.
+
+    Fast paths first: ISO 8601 (our own stored timestamps) via fromisoformat,
+    then RFC 822 (RSS pubDate) via email.utils. dateutil's heuristic parser
+    is only the last resort. Memoized — the same strings recur across feeds,
+    url_first_seen, and repeated is_recent/url_age_days calls.
+    """
+    # Non-strings (e.g. a hand-edited url_first_seen value) are rejected before the
+    # cache, which can't hash lists
+    if not s or not isinstance(s, str):
+        return None
+    return _parse_dt_cached(s)
+
+
+@lru_cache(maxsize=4096)
+def _parse_dt_cached(s: str) -> Optional[datetime]:
+    try:
+        dt = datetime.fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s)
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(s)
+        except (TypeError, ValueError, IndexError):
             try:
-                dt = dateparser.parse(val)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt.isoformat()
-            except Exception:
-                pass
+                dt = dateparser.parse(s)
+            except (ValueError, OverflowError):
+                return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def parse_rss_published(entry) -> Optional[datetime]:
+    # feedparser has already parsed the date into a UTC struct_time for
+    # nearly every WSJ entry; building the datetime from it skips string
+    # parsing. Both paths return UTC, so every published_at ends in +00:00.
     for key in ("published_parsed", "updated_parsed"):
         st = entry.get(key)
         if st:
             try:
-                dt = datetime(*st[:6], tzinfo=timezone.utc)
-                return dt.isoformat()
+                return datetime(*st[:6], tzinfo=timezone.utc)
             except Exception:
                 pass
-    return ""
+    for key in ("published", "updated", "created"):
+        val = entry.get(key)
+        if val:
+            dt = parse_dt(val)
+            if dt is not None:
+                return dt.astimezone(timezone.utc)  # parse_dt keeps the source offset
+    return None
 
 
-def is_recent(published_iso: str, hours: int = RECENT_HOURS) -> bool:
-    if not published_iso:
+def parse_rss_published_iso(entry) -> str:
+    dt = parse_rss_published(entry)
+    return dt.isoformat() if dt is not None else ""
+
+
+def is_recent(published_iso: str, hours: int = RECENT_HOURS,
+              cutoffs: Optional[Dict[int, datetime]] = None) -> bool:
+    """`cutoffs` (from recency_cutoffs) pins "now" for a whole run."""
+    dt = parse_dt(published_iso)
+    if dt is None:
         return False
-    try:
-        dt = dateparser.parse(published_iso)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
+    cutoff = cutoffs.get(hours) if cutoffs else None
+    if cutoff is None:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        return dt >= cutoff
-    except Exception:
-        return False
+    return dt >= cutoff
+
+
+def recency_cutoffs(now: datetime) -> Dict[int, datetime]:
+    """Cutoff datetime for every configured window, computed once per run."""
+    return {h: now - timedelta(hours=h) for h in {*CATEGORY_WINDOW_HOURS.values(), RECENT_HOURS}}
 
 
 def classify_category(title: str, summary: str) -> str:
@@ -173,10 +302,14 @@ def classify_category(title: str, summary: str) -> str:
 
 def classify_categories(title: str, summary: str) -> List[str]:
     """Return all matching categories (primary first). Always at least one."""
-    text = f"{title} {summary}"
-    matched = [cat for cat, rx in CATEGORY_RULES if rx.search(text)]
+    return _categories_lower(f"{title} {summary}".lower())
+
+
+def _categories_lower(text_lower: str) -> List[str]:
+    hits = category_hits(text_lower)
+    matched = [cat for cat, _ in CATEGORY_RULES if cat in hits]
     if not matched:
-        if FRAMING_TERMS.search(text):
+        if "framing" in signal_hits(text_lower):
             return ["Narrative/Opinion"]
         return ["Cyclical"]
     return matched
@@ -192,15 +325,16 @@ def signal_strength(score: int) -> str:
 
 def time_horizon(category: str, text: str = "") -> str:
     """Derive time horizon from strong text cues first, then category default."""
-    if text and IMMEDIATE_CUES.search(text):
-        return "Immediate"
-    if text and STRUCTURAL_CUES.search(text):
-        return "Structural"
-    if category in ["Earnings", "Markets", "Policy/Regulatory"]:
+    return _horizon_lower(category, text.lower() if text else "")
+
+
+def _horizon_lower(category: str, text_lower: str) -> str:
+    hits = signal_hits(text_lower) if text_lower else frozenset()
+    if "immediate" in hits:
         return "Immediate"
-    if category == "Structural":
+    if "structural" in hits:
         return "Structural"
-    return "Near-term"
+    return CATEGORY_HORIZON.get(category, "Near-term")
 
 
 def confidence(score: int) -> int:
@@ -222,33 +356,53 @@ def make_triage_decision(strength: str, category: str) -> str:
     return "Read"
 
 
+def prepare_theme(theme: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a theme with its watch_triggers / keywords_any lowercased once."""
+    return {
+        **theme,
+        "_triggers_lc": tuple(t.lower() for t in (theme.get("watch_triggers", []) or [])),
+        "_keywords_lc": tuple(kw.lower() for kw in (theme.get("keywords_any", []) or [])),
+    }
+
+
+def prepare_themes(themes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Preprocess themes once per run so score_item doesn't re-lowercase them per item."""
+    return [prepare_theme(t) for t in themes]
+
+
 def score_item(title: str, summary: str, source: str,
                theme_triggers: Optional[List[Dict[str, Any]]] = None) -> Tuple[int, List[str], List[str]]:
     """Score an item and return (score, reasons, matched_theme_names)."""
-    text       = f"{title} {summary}"
-    text_lower = text.lower()
-    title_lower = title.lower()
+    text_lower = f"{title} {summary}".lower()
+    return _score_lower(text_lower, title.lower(), _categories_lower(text_lower)[0],
+                        source, theme_triggers)
+
+
+def _score_lower(text_lower: str, title_lower: str, category: str, source: str,
+                 theme_triggers: Optional[List[Dict[str, Any]]] = None) -> Tuple[int, List[str], List[str]]:
+    """score_item body, for callers that already lowercased the text and classified it."""
     score  = SCORE_BASELINE
     reasons: List[str] = []
     matched_themes: List[str] = []
 
-    if NUMERIC.search(text):
+    hits = signal_hits(text_lower)
+
+    if "numeric" in hits:
         score += 12
         reasons.append("Includes quantitative data")
 
-    category = classify_category(title, summary)
-    if category in ["Policy/Regulatory", "Earnings", "Structural"]:
+    if category in CONCRETE_CATEGORIES:
         score += 12
         reasons.append(f"Concrete category: {category}")
 
-    if LOW_SIGNAL_MARKET_MOVE.search(text):
+    if "market_move" in hits:
         score -= 18
         reasons.append("Market-move headline")
 
-    if FRAMING_TERMS.search(text):
+    if "framing" in hits:
         score -= 14
         reasons.append("Framing/explainer language")
-    if MODAL_TERMS.search(text):
+    if "modal" in hits:
         score -= 4
         reasons.append("Hedging/modality language")
 
@@ -263,11 +417,13 @@ def score_item(title: str, summary: str, source: str,
     #   Two-hit requirement prevents single generic keywords from firing.
     if theme_triggers:
         for theme in theme_triggers:
+            if "_keywords_lc" not in theme:
+                theme = prepare_theme(theme)
             name     = theme.get("name", "")
-            triggers = theme.get("watch_triggers", []) or []
-            keywords = [kw.lower() for kw in (theme.get("keywords_any", []) or [])]
+            triggers = theme["_triggers_lc"]
+            keywords = theme["_keywords_lc"]
 
-            phrase_matched = any(t.lower() in text_lower for t in triggers)
+            phrase_matched = any(t in text_lower for t in triggers)
 
             if phrase_matched:
                 matched_themes.append(name)
@@ -275,8 +431,11 @@ def score_item(title: str, summary: str, source: str,
                 reasons.append(f"Theme match (phrase): {name}")
             elif keywords:
                 kw_hits = [kw for kw in keywords if kw in text_lower]
-                kw_in_headline = any(kw in title_lower for kw in keywords)
-                kw_matched = len(kw_hits) >= 2 or (kw_in_headline and kw_hits)
+                # The headline is part of text_lower, so only keywords that
+                # already hit can be in it — no need to rescan the full list.
+                kw_matched = len(kw_hits) >= 2 or (
+                    bool(kw_hits) and any(kw in title_lower for kw in kw_hits)
+                )
 
                 if kw_matched:
                     matched_themes.append(name)
@@ -287,25 +446,72 @@ def score_item(title: str, summary: str, source: str,
     return score, reasons, matched_themes
 
 
+# url -> {"etag": ..., "last_modified": ...}; loaded from / saved to run_state.json by main()
+FEED_VALIDATORS: Dict[str, Dict[str, str]] = {}
+
+
+def feed_cache_path(url: str) -> Path:
+    return FEED_CACHE_DIR / (hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".xml")
+
+
 def fetch_feed(url: str):
     """
     Fetch a feed URL with a per-request timeout. Does NOT touch global socket state.
     Returns a feedparser result, or None if the fetch fails.
+
+    Sends If-None-Match / If-Modified-Since from FEED_VALIDATORS when a cached
+    body exists; on 304 the cached body is re-parsed instead of downloaded.
+    The dashboard is rebuilt from every feed on each run (recency windows
+    move), so an unchanged feed still has to be parsed — only the transfer
+    is saved.
     """
+    headers = {"User-Agent": "wsj-triage/1.0 (feedparser)"}
+    cache_path = feed_cache_path(url)
+    validators = FEED_VALIDATORS.get(url) or {}
+    if validators and cache_path.exists():
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "wsj-triage/1.0 (feedparser)"})
-        with urllib.request.urlopen(req, timeout=FEED_TIMEOUT) as resp:
-            raw = resp.read()
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with _FEED_OPENER.open(req, timeout=FEED_TIMEOUT) as resp:
+                raw = resp.read()
+                etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            log.info("Feed unchanged (304): %s", url)
+            return feedparser.parse(cache_path.read_bytes())
+
+        if etag or last_modified:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(raw)
+            FEED_VALIDATORS[url] = {k: v for k, v in (("etag", etag), ("last_modified", last_modified)) if v}
+        else:
+            FEED_VALIDATORS.pop(url, None)
         return feedparser.parse(raw)
     except Exception as e:
         log.warning("Feed fetch failed for %s: %s", url, e)
         return None
 
 
+def fetch_all_feeds(urls: List[str]) -> Dict[str, Any]:
+    """
+    Fetch all feeds concurrently (threads overlap the network waits).
+    Returns {url: feedparser result or None} in the order of `urls`.
+    """
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_FEED_WORKERS, len(urls))) as ex:
+        return dict(zip(urls, ex.map(fetch_feed, urls)))
+
+
 def load_json(path: Path, default: Any) -> Any:
     if path.exists():
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            return orjson.loads(path.read_bytes())
         except Exception:
             return default
     return default
@@ -313,9 +519,10 @@ def load_json(path: Path, default: Any) -> Any:
 
 def save_json(path: Path, obj: Any) -> None:
     """Atomic write: write to temp file then rename to avoid corruption on crash."""
-    data = json.dumps(obj, indent=2, ensure_ascii=False)
+    # Same layout as json.dumps(indent=2, ensure_ascii=False), produced directly as UTF-8 bytes
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
     tmp = path.with_suffix(".tmp")
-    tmp.write_text(data, encoding="utf-8")
+    tmp.write_bytes(data)
     os.replace(tmp, path)
 
 
@@ -327,17 +534,48 @@ def save_url_first_seen(d: Dict[str, str]) -> None:
     save_json(URL_AGE_FILE, d)
 
 
-def url_age_days(first_seen_iso: str) -> Optional[int]:
-    if not first_seen_iso:
-        return None
-    try:
-        dt = dateparser.parse(first_seen_iso)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        delta = datetime.now(timezone.utc) - dt
-        return max(0, int(delta.total_seconds() // 86400))
-    except Exception:
+def url_age_days(first_seen_iso: str, now: Optional[datetime] = None) -> Optional[int]:
+    """Whole days since first_seen_iso; callers looping over many entries pass one `now`."""
+    # parse_dt is memoized, so URLs sharing a run's first-seen timestamp parse once
+    dt = parse_dt(first_seen_iso)
+    if dt is None:
         return None
+    delta = (now or datetime.now(timezone.utc)) - dt
+    return max(0, int(delta.total_seconds() // 86400))
+
+
+def _is_canonical_utc_iso(ts: str) -> bool:
+    """True for utc_now_iso() output, e.g. 2026-01-30T22:52:53.123456+00:00."""
+    return len(ts) == 32 and ts[10] == "T" and ts.endswith("+00:00")
+
+
+def prune_url_first_seen(url_first_seen: Dict[str, str]) -> int:
+    """
+    Drop entries whose age in whole days exceeds URL_PRUNE_DAYS; returns the count.
+
+    Values written by utc_now_iso() share one fixed-width layout, so they order
+    lexicographically and compare against a precomputed cutoff string without
+    being parsed. Other strings (hand-edited, older formats) go through
+    url_age_days; values that can't be read as a date are kept.
+    """
+    # age > URL_PRUNE_DAYS whole days  <=>  first seen at or before now - (URL_PRUNE_DAYS + 1) days
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=URL_PRUNE_DAYS + 1)
+    cutoff_iso = cutoff.isoformat(timespec="microseconds")
+    stale = []
+    for u, ts in url_first_seen.items():
+        if not isinstance(ts, str):
+            continue  # unreadable value: kept, as an unparseable string is
+        if _is_canonical_utc_iso(ts):
+            if ts <= cutoff_iso:
+                stale.append(u)
+        else:
+            age = url_age_days(ts, now)
+            if age is not None and age > URL_PRUNE_DAYS:
+                stale.append(u)
+    for u in stale:
+        del url_first_seen[u]
+    return len(stale)
 
 
 def evergreen_badge(first_seen_iso: str) -> Tuple[bool, Optional[int]]:
@@ -351,14 +589,16 @@ def build_schema(item: Dict[str, Any], theme_triggers: Optional[List[Dict[str, A
     title   = item["title"]
     summary = item["summary"]
     source  = item["source"]
-    text    = f"{title} {summary}"
 
-    score, bullets, matched_themes = score_item(title, summary, source, theme_triggers)
-    categories           = classify_categories(title, summary)
+    # Lowercase and classify once; scoring and horizon reuse both.
+    # main() already classified the item for its recency window.
+    text_lower           = f"{title} {summary}".lower()
+    categories           = item.get("categories") or _categories_lower(text_lower)
     category             = categories[0]
     secondary_categories = categories[1:]
+    score, bullets, matched_themes = _score_lower(text_lower, title.lower(), category, source, theme_triggers)
     strength             = signal_strength(score)
-    horizon              = time_horizon(category, text)
+    horizon              = _horizon_lower(category, text_lower)
     decision             = make_triage_decision(strength, category)
 
     is_evergreen, age_days = evergreen_badge(item.get("url_first_seen_at", ""))
@@ -387,6 +627,22 @@ def build_schema(item: Dict[str, Any], theme_triggers: Optional[List[Dict[str, A
     }
 
 
+def dashboard_json_bytes(schema_items: List[Dict[str, Any]]) -> bytes:
+    """
+    Serialize items for the page's inline JSON data block, as UTF-8 bytes.
+
+    orjson emits UTF-8 directly (the page is served as UTF-8, so the
+    \\uXXXX escaping of ensure_ascii only bloated the payload). "<" can only
+    occur inside JSON strings, so it is written as \\u003c: a headline
+    containing "</script>" or "<!--" can't end or confuse the script block.
+    """
+    return orjson.dumps(schema_items).replace(b"<", b"\\u003c")
+
+
+# Placeholder for the data block; main() splices the JSON bytes in its place
+_DATA_SLOT = "__TRIAGE_DATA_SLOT__"
+
+
 # =========================
 # HTML Template
 # Note: Analyze links use relative paths (/analyze?...) and only work when
@@ -410,7 +666,9 @@ HTML_TEMPLATE = Template(r"""
   .controls { margin:14px 0 18px; display:grid; grid-template-columns:1.2fr .9fr .7fr .7fr .8fr .65fr .65fr .7fr; gap:10px; }
   .card.focused { outline:2px solid #5b8def; outline-offset:-2px; }
   input, select { width:100%; padding:10px 12px; border-radius:12px; border:1px solid #2a2d3a; background:#0f1118; color:var(--text); outline:none; }
-  .card { background:var(--panel); border-radius:14px; padding:14px; margin-bottom:12px; border:1px solid #252839; border-left:3px solid #252839; }
+  /* content-visibility: the browser skips layout/paint for off-screen cards, while
+     every node stays in the DOM for j/k navigation and find-in-page */
+  .card { background:var(--panel); border-radius:14px; padding:14px; margin-bottom:12px; border:1px solid #252839; border-left:3px solid #252839; content-visibility:auto; contain-intrinsic-size:auto 170px; }
   .card.read  { border-left-color: rgba(74,222,128,.5); }
   .card.skip  { opacity: 0.75; }
   .chips { display:flex; flex-wrap:wrap; gap:8px; }
@@ -451,8 +709,8 @@ HTML_TEMPLATE = Template(r"""
 
   <div class="controls">
     <input id="q" placeholder="Search title…" />
-    <select id="feed"><option value="">All feeds</option></select>
-    <select id="cat"><option value="">All categories</option></select>
+    <select id="feed"><option value="">All feeds</option>{% for f in feeds %}<option>{{ f | e }}</option>{% endfor %}</select>
+    <select id="cat"><option value="">All categories</option>{% for c in categories %}<option>{{ c | e }}</option>{% endfor %}</select>
     <select id="sig"><option value="">All signal</option><option>High</option><option>Medium</option><option>Low</option></select>
     <select id="hzn"><option value="">All horizons</option><option>Immediate</option><option>Near-term</option><option>Structural</option></select>
     <select id="dec"><option value="">All decisions</option><option>Read</option><option>Skip</option></select>
@@ -463,9 +721,61 @@ HTML_TEMPLATE = Template(r"""
   <div id="cards"></div>
 </div>
 
+<template id="card-tpl">
+  <div class="card">
+    <div class="chips"></div>
+    <div class="title">
+      <a class="article" target="_blank" rel="noopener"></a>
+      <span style="color:#777"> • </span>
+      <a class="analyze"
+         target="_self"
+         onclick="event.stopPropagation();"
+         style="color:#9ad; font-weight:650; text-decoration:none">Analyze</a>
+    </div>
+    <div class="meta"></div>
+    <div class="details mechanism"></div>
+    <details>
+      <summary>Details</summary>
+      <div class="details"><strong>Signal bullets</strong></div>
+      <ul class="bullets"></ul>
+      <div class="details"><strong>Snippet</strong></div>
+      <div class="details snippet"></div>
+    </details>
+  </div>
+</template>
+
+<!-- Inert data block: not executed, so the HTML parser only scans it for the
+     end tag; JSON.parse below is much cheaper than compiling a JS literal. -->
+<script type="application/json" id="triage-data">{{ data | safe }}</script>
 <script>
-const DATA = {{ data | safe }};
+const DATA = JSON.parse(document.getElementById("triage-data").textContent);
 const root = document.getElementById("cards");
+let cards = [];  // card elements from the last render, for keyboard navigation
+
+// Per-item keys computed once instead of per keystroke / per comparison:
+// lowercased title for search, numeric score, and published time in epoch ms
+// (parsed, so the order stays right whatever offset a timestamp carries)
+DATA.forEach(x => {
+  x._title_lc = (x.title || "").toLowerCase();
+  x._s = +x.raw_score || 0;
+  x._t = Date.parse(x.published_at) || 0;
+});
+
+const COLL = new Intl.Collator("en", {sensitivity: "base"});
+
+// Each sort order is computed once, on first use; filtering keeps the order,
+// so render() never sorts
+const byScore = (a,b) => b._s - a._s;
+const COMPARATORS = {
+  score:    byScore,
+  date:     (a,b) => b._t - a._t,
+  category: (a,b) => COLL.compare(a.category || "", b.category || "") || byScore(a, b),
+};
+const ORDERS = {};
+function sortedData(sortBy) {
+  if (!COMPARATORS[sortBy]) sortBy = "score";
+  return ORDERS[sortBy] || (ORDERS[sortBy] = DATA.slice().sort(COMPARATORS[sortBy]));
+}
 
 const els = {
   q:    document.getElementById("q"),
@@ -491,19 +801,9 @@ const els = {
     `${DATA.length} items — High:${bands.High}  Med:${bands.Medium}  Low:${bands.Low} — Read:${decisions.Read}  Skip:${decisions.Skip}`;
 })();
 
-function uniq(arr) { return Array.from(new Set(arr.filter(Boolean))).sort(); }
-
-uniq(DATA.map(x => x.feed)).forEach(f => {
-  const opt = document.createElement("option");
-  opt.value = f; opt.textContent = f;
-  els.feed.appendChild(opt);
-});
-
-uniq(DATA.map(x => x.category)).forEach(c => {
-  const opt = document.createElement("option");
-  opt.value = c; opt.textContent = c;
-  els.cat.appendChild(opt);
-});
+// Last render's inputs and result: typing more of a query only narrows the
+// previous matches, so those are re-filtered instead of the whole dataset
+let last = {key: null, q: "", xs: []};
 
 function render() {
   const q    = (els.q.value || "").toLowerCase().trim();
@@ -513,121 +813,127 @@ function render() {
   const hzn  = els.hzn.value;
   const dec  = els.dec.value;
   const newf = els.newf.value;
+  const sortBy = els.sort.value;
 
-  let xs = DATA.slice();
-
-  if (q)    xs = xs.filter(x => (x.title || "").toLowerCase().includes(q));
-  if (feed) xs = xs.filter(x => x.feed === feed);
-  if (cat)  xs = xs.filter(x => x.category === cat || (x.secondary_categories || []).includes(cat));
-  if (sig)  xs = xs.filter(x => x.signal_strength === sig);
-  if (hzn)  xs = xs.filter(x => x.time_horizon === hzn);
-  if (dec)  xs = xs.filter(x => x.triage_decision === dec);
+  const key = [feed, cat, sig, hzn, dec, newf, sortBy].join("\u0001");
+  if (key === last.key && q === last.q) return;
 
-  if (newf === "only") xs = xs.filter(x => x.new_since_last_run);
-  if (newf === "no")   xs = xs.filter(x => !x.new_since_last_run);
+  // Card nodes are reused across renders, so clear the old focus before the list changes
+  if (focusedCard) focusedCard.classList.remove("focused");
+  focusedCard = null;
+  focusIdx = -1;
 
-  const sortBy = els.sort.value;
-  if (sortBy === "date") {
-    xs.sort((a,b) => (b.published_at || "").localeCompare(a.published_at || ""));
-  } else if (sortBy === "category") {
-    xs.sort((a,b) => (a.category || "").localeCompare(b.category || "") || (b.raw_score||0) - (a.raw_score||0));
+  let xs;
+  if (key === last.key && q.startsWith(last.q)) {
+    xs = last.xs.filter(x => x._title_lc.includes(q));
   } else {
-    xs.sort((a,b) => (b.raw_score || 0) - (a.raw_score || 0));
+    const base = sortedData(sortBy);
+    const wantNew = newf === "only" ? true : newf === "no" ? false : null;
+
+    // All facets in one pass: a single array allocation instead of one per active filter
+    xs = base.filter(x =>
+      (!q    || x._title_lc.includes(q)) &&
+      (!feed || x.feed === feed) &&
+      (!cat  || x.category === cat || (x.secondary_categories || []).includes(cat)) &&
+      (!sig  || x.signal_strength === sig) &&
+      (!hzn  || x.time_horizon === hzn) &&
+      (!dec  || x.triage_decision === dec) &&
+      (wantNew === null || !!x.new_since_last_run === wantNew));
   }
+  last = {key, q, xs};
 
-  root.innerHTML = "";
   if (!xs.length) {
     const d = document.createElement("div");
     d.className = "empty";
     d.textContent = "No items match your filters.";
-    root.appendChild(d);
+    root.replaceChildren(d);
+    cards = [];
     return;
   }
 
-  for (const x of xs) {
-    const d = document.createElement("div");
-    d.className = "card " + (x.triage_decision === "Read" ? "read" : "skip");
-
-    const evergreenChip = x.evergreen_resurfaced
-      ? `<span class="chip warn">Evergreen • first seen ${x.url_age_days}d ago</span>`
-      : "";
-
-    const newChip = x.new_since_last_run ? `<span class="chip new">NEW</span>` : "";
-
-    const decisionChip = `<span class="chip ${x.triage_decision === "Read" ? "read" : "skip"}">${x.triage_decision}</span>`;
-
-    const secondaryCatChips = (x.secondary_categories || []).map(c => `<span class="chip secondary">${c}</span>`).join("");
-
-    const themeChips = (x.matched_themes || []).map(t => `<span class="chip theme">${t}</span>`).join("");
-
-    // Relative path — only works when served via Flask (python run.py serve)
-    const analyzeHref = `/analyze?u=${encodeURIComponent(x.url || "")}&t=${encodeURIComponent(x.title || "")}`;
-
-    d.innerHTML = `
-      <div class="chips">
-        <span class="chip">${x.feed || "WSJ"}</span>
-        <span class="chip">${x.category}</span>
-        ${secondaryCatChips}
-        <span class="chip">${x.signal_strength}</span>
-        ${decisionChip}
-        <span class="chip">Conf ${x.confidence}/5</span>
-        ${newChip}
-        ${themeChips}
-        ${evergreenChip}
-      </div>
-
-      <div class="title">
-        <a href="${x.url}" target="_blank" rel="noopener">${x.title}</a>
-        <span style="color:#777"> • </span>
-        <a href="${analyzeHref}"
-	    target="_self"
-	    onclick="event.stopPropagation();"
-	    style="color:#9ad; font-weight:650; text-decoration:none">
-	  Analyze
-	</a>
-      </div>
-
-      <div class="meta">RSS published: ${x.published_at || ""} • ${x.time_horizon}</div>
-
-      ${x.mechanism ? `<div class="details">${x.mechanism}</div>` : ""}
-
-      <details>
-        <summary>Details</summary>
-        <div class="details"><strong>Signal bullets</strong></div>
-        <ul>${(x.signal_bullets || []).map(b => `<li>${b}</li>`).join("")}</ul>
-        <div class="details"><strong>Snippet</strong></div>
-        <div class="details">${x.snippet || "—"}</div>
-      </details>
-    `;
-    root.appendChild(d);
-  }
+  // Each card node is built once and reused; a fragment lands them in one insert
+  const frag = document.createDocumentFragment();
+  for (const x of xs) frag.appendChild(x._el || (x._el = buildCard(x)));
+  root.replaceChildren(frag);
+  cards = Array.from(root.children);
+}
+
+const CARD_TPL = document.getElementById("card-tpl").content.firstElementChild;
+
+function elem(tag, cls, text) {
+  const e = document.createElement(tag);
+  if (cls) e.className = cls;
+  e.textContent = text ?? "";
+  return e;
+}
+
+// Filled with textContent/href only, so item strings are never parsed as HTML
+function buildCard(x) {
+  const cls = x.triage_decision === "Read" ? "read" : "skip";
+  const node = CARD_TPL.cloneNode(true);
+  node.classList.add(cls);
+
+  const chips = [
+    elem("span", "chip", x.feed || "WSJ"),
+    elem("span", "chip", x.category),
+    ...(x.secondary_categories || []).map(c => elem("span", "chip secondary", c)),
+    elem("span", "chip", x.signal_strength),
+    elem("span", `chip ${cls}`, x.triage_decision),
+    elem("span", "chip", `Conf ${x.confidence}/5`),
+  ];
+  if (x.new_since_last_run) chips.push(elem("span", "chip new", "NEW"));
+  (x.matched_themes || []).forEach(t => chips.push(elem("span", "chip theme", t)));
+  if (x.evergreen_resurfaced) chips.push(elem("span", "chip warn", `Evergreen • first seen ${x.url_age_days}d ago`));
+  node.querySelector(".chips").append(...chips);
+
+  const article = node.querySelector("a.article");
+  article.href = x.url || "";
+  article.textContent = x.title || "";
+  // Relative path — only works when served via Flask (python run.py serve)
+  node.querySelector("a.analyze").href =
+    `/analyze?u=${encodeURIComponent(x.url || "")}&t=${encodeURIComponent(x.title || "")}`;
+
+  node.querySelector(".meta").textContent = `RSS published: ${x.published_at || ""} • ${x.time_horizon}`;
+
+  const mechanism = node.querySelector(".mechanism");
+  if (x.mechanism) mechanism.textContent = x.mechanism;
+  else mechanism.remove();
+
+  node.querySelector(".bullets").append(...(x.signal_bullets || []).map(b => elem("li", "", b)));
+  node.querySelector(".snippet").textContent = x.snippet || "—";
+  return node;
+}
+
+// Coalesce bursts of input (fast typing, input+change pairs) into one render per frame
+let renderPending = 0;
+function scheduleRender() {
+  if (!renderPending) renderPending = requestAnimationFrame(() => { renderPending = 0; render(); });
 }
 
 ["input","change"].forEach(evt => {
-  els.q.addEventListener(evt, render);
-  els.feed.addEventListener(evt, render);
-  els.cat.addEventListener(evt, render);
-  els.sig.addEventListener(evt, render);
-  els.hzn.addEventListener(evt, render);
-  els.dec.addEventListener(evt, render);
-  els.newf.addEventListener(evt, render);
-  els.sort.addEventListener(evt, render);
+  els.q.addEventListener(evt, scheduleRender);
+  els.feed.addEventListener(evt, scheduleRender);
+  els.cat.addEventListener(evt, scheduleRender);
+  els.sig.addEventListener(evt, scheduleRender);
+  els.hzn.addEventListener(evt, scheduleRender);
+  els.dec.addEventListener(evt, scheduleRender);
+  els.newf.addEventListener(evt, scheduleRender);
+  els.sort.addEventListener(evt, scheduleRender);
 });
 
 // Keyboard navigation: j/k to move, o to open article, a to analyze
 let focusIdx = -1;
-function getCards() { return root.querySelectorAll(".card"); }
+let focusedCard = null;
 function setFocus(idx) {
-  const cards = getCards();
   if (!cards.length) return;
-  cards.forEach(c => c.classList.remove("focused"));
+  if (focusedCard) focusedCard.classList.remove("focused");
   focusIdx = Math.max(0, Math.min(idx, cards.length - 1));
-  cards[focusIdx].classList.add("focused");
-  cards[focusIdx].scrollIntoView({ block: "nearest", behavior: "smooth" });
+  focusedCard = cards[focusIdx];
+  focusedCard.classList.add("focused");
+  focusedCard.scrollIntoView({ block: "nearest", behavior: "smooth" });
 }
 document.addEventListener("keydown", (e) => {
   if (e.target.tagName === "INPUT" || e.target.tagName === "SELECT" || e.target.tagName === "TEXTAREA") return;
-  const cards = getCards();
   if (e.key === "j") { setFocus(focusIdx + 1); e.preventDefault(); }
   else if (e.key === "k") { setFocus(focusIdx - 1); e.preventDefault(); }
   else if (e.key === "o" && focusIdx >= 0 && focusIdx < cards.length) {
@@ -672,15 +978,22 @@ def main() -> None:
     run_state = load_json(RUN_STATE_FILE, {"last_run_at": "", "last_run_urls": []})
     last_run_urls = set(run_state.get("last_run_urls", []) or [])
 
+    FEED_VALIDATORS.clear()
+    saved_validators = run_state.get("feed_validators")
+    if isinstance(saved_validators, dict):
+        FEED_VALIDATORS.update({u: v for u, v in saved_validators.items() if u in FEEDS and isinstance(v, dict)})
+
     url_first_seen = load_url_first_seen()
     now_iso = utc_now_iso()
+    cutoffs = recency_cutoffs(datetime.now(timezone.utc))
 
-    items: List[Dict[str, Any]] = []
+    # Keyed by link: deduplicates across feeds as entries arrive. Re-assigning
+    # an existing key keeps its first position and the last entry's fields.
+    items_by_url: Dict[str, Dict[str, Any]] = {}
     total_seen_new = 0
     total_recent = 0
 
-    for url in FEEDS:
-        feed = fetch_feed(url)
+    for url, feed in fetch_all_feeds(FEEDS).items():
         if feed is None:
             continue  # fetch_feed already logged the warning
 
@@ -692,25 +1005,33 @@ def main() -> None:
             log.warning("Feed returned 0 entries: %s", url)
 
         for e in feed.entries[:200]:
-            title      = (e.get("title") or "").strip()
-            link       = (e.get("link") or "").strip()
-            summary    = strip_html(e.get("summary", ""))
-            published_at = parse_rss_published_iso(e)
-
+            title = (e.get("title") or "").strip()
+            link  = (e.get("link") or "").strip()
             if not title or not link:
                 continue
 
+            published_dt = parse_rss_published(e)
+
             if link not in url_first_seen:
                 url_first_seen[link] = now_iso
                 total_seen_new += 1
 
-            cat_guess = classify_category(title, summary)
-            if not is_recent(published_at, hours=window_hours_for_category(cat_guess)):
+            # Recency is checked on the datetime itself (no ISO round-trip).
+            # Older than every category window: no classification can keep it,
+            # so skip strip_html and the regex scans (first-seen is recorded above)
+            if published_dt is None or published_dt < cutoffs[MAX_WINDOW_HOURS]:
                 continue
 
+            summary    = strip_html(e.get("summary", ""))
+            categories = classify_categories(title, summary)
+            if published_dt < cutoffs[window_hours_for_category(categories[0])]:
+                continue
+
+            published_at = published_dt.isoformat()
+
             total_recent += 1
 
-            items.append({
+            items_by_url[link] = {
                 "title":              title,
                 "link":               link,
                 "summary":            summary,
@@ -719,30 +1040,23 @@ def main() -> None:
                 "feed":               feed_title,
                 "url_first_seen_at":  url_first_seen.get(link, ""),
                 "new_since_last_run": (link not in last_run_urls),
-            })
+                "categories":         categories,
+            }
 
     # Prune url_first_seen entries older than URL_PRUNE_DAYS
-    pruned = 0
-    for u, ts in list(url_first_seen.items()):
-        age = url_age_days(ts)
-        if age is not None and age > URL_PRUNE_DAYS:
-            del url_first_seen[u]
-            pruned += 1
+    pruned = prune_url_first_seen(url_first_seen)
     if pruned:
         log.info("Pruned %d URLs older than %d days from url_first_seen", pruned, URL_PRUNE_DAYS)
 
     save_url_first_seen(url_first_seen)
 
-    # Deduplicate by URL across feeds
-    by_url: Dict[str, Dict[str, Any]] = {}
-    for it in items:
-        by_url[it["link"]] = it
-    items = list(by_url.values())
+    items = list(items_by_url.values())
 
     # Persist run state for next diff
     save_json(RUN_STATE_FILE, {
         "last_run_at":   now_iso,
-        "last_run_urls": [it["link"] for it in items],
+        "last_run_urls": list(items_by_url),
+        "feed_validators": FEED_VALIDATORS,
     })
 
     themes_obj = load_json(THEMES_FILE, {})
@@ -755,7 +1069,8 @@ def main() -> None:
         except Exception:
             themes_summary = ""
 
-    schema_items = [build_schema(i, active_themes) for i in items]
+    prepared_themes = prepare_themes(active_themes)
+    schema_items = [build_schema(i, prepared_themes) for i in items]
 
     # Calibration summary — helps spot if Medium is dominating after threshold changes
     if schema_items:
@@ -774,10 +1089,17 @@ def main() -> None:
             decision_counts["Skip"], 100 * decision_counts["Skip"] / total,
         )
 
-    html = HTML_TEMPLATE.render(
+    # The page shell is rendered around a placeholder and the orjson bytes are
+    # spliced in, so the (large) data payload never passes through Jinja or
+    # a str decode/encode round-trip. The data block is the last slot in the
+    # page, so rpartition can't hit a placeholder-lookalike in a theme name.
+    page = HTML_TEMPLATE.render(
         generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
         recent_hours=RECENT_HOURS,
-        data=json.dumps(schema_items, ensure_ascii=True),
+        data=_DATA_SLOT,
+        # Filter options rendered into the page rather than derived from DATA in JS
+        feeds=sorted({i["feed"] for i in schema_items if i.get("feed")}),
+        categories=sorted({i["category"] for i in schema_items if i.get("category")}),
         themes_summary=themes_summary,
         scoring_warning=not _SCORING_CFG_VALID,
         score_baseline=SCORE_BASELINE,
@@ -785,8 +1107,16 @@ def main() -> None:
         medium_threshold=MEDIUM_THRESHOLD,
     )
 
+    head, _, tail = page.rpartition(_DATA_SLOT)
+    # Written piecewise, so the full page is never joined into one buffer
+    parts = (head.encode("utf-8"), dashboard_json_bytes(schema_items), tail.encode("utf-8"))
+
     out = BASE_DIR / "output" / "triage.html"
-    out.write_text(html, encoding="utf-8")
+    with out.open("wb") as f:
+        f.writelines(parts)
+    # Pre-compressed copy served by server.py to gzip-capable clients
+    with gzip.open(out.with_name(out.name + ".gz"), "wb", compresslevel=9) as gz:
+        gz.writelines(parts)
 
     log.info("Scoring: baseline=%d, High≥%d, Medium≥%d", SCORE_BASELINE, HIGH_THRESHOLD, MEDIUM_THRESHOLD)
     log.info("New URLs added to evergreen store this run: %d", total_seen_new)
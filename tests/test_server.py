@@ -50,6 +50,16 @@ class TestSaveEndpoint:
         saved = json.loads(log_file.read_text().strip())
         assert saved.get("server_received_at"), "server_received_at should be set"
 
+    def test_save_appends_one_line_per_request(self, client, tmp_path, monkeypatch):
+        log_file = tmp_path / "test_log.jsonl"
+        monkeypatch.setattr(server_module, "LOG_FILE", log_file)
+        client.post("/save", json=VALID_PAYLOAD)
+        client.post("/save", json={**VALID_PAYLOAD, "title": "Café — 86¢ EPS"})
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert "Café — 86¢ EPS" in lines[1]  # written as UTF-8, not \u-escaped
+        assert json.loads(lines[1])["title"] == "Café — 86¢ EPS"
+
     def test_save_act_action_is_valid(self, client, tmp_path, monkeypatch):
         monkeypatch.setattr(server_module, "LOG_FILE", tmp_path / "test_log.jsonl")
         payload = {**VALID_PAYLOAD, "action": "Act"}
@@ -94,6 +104,13 @@ class TestSaveValidation:
         r = client.post("/save", json=payload)
         assert r.status_code == 400
 
+    def test_non_string_enum_value_rejected(self, client, tmp_path, monkeypatch):
+        monkeypatch.setattr(server_module, "LOG_FILE", tmp_path / "test_log.jsonl")
+        payload = {**VALID_PAYLOAD, "action": ["Act"]}
+        r = client.post("/save", json=payload)
+        assert r.status_code == 400
+        assert "action" in r.get_json()["error"]
+
     def test_payload_must_be_object(self, client, tmp_path, monkeypatch):
         monkeypatch.setattr(server_module, "LOG_FILE", tmp_path / "test_log.jsonl")
         r = client.post("/save", json=[1, 2, 3])
@@ -105,6 +122,18 @@ class TestSaveValidation:
         r = client.post("/save", data="not-json", content_type="application/json")
         assert r.status_code == 400
 
+    def test_empty_body(self, client, tmp_path, monkeypatch):
+        monkeypatch.setattr(server_module, "LOG_FILE", tmp_path / "test_log.jsonl")
+        r = client.post("/save", data=b"", content_type="application/json")
+        assert r.status_code == 400
+        assert r.get_json()["error"] == "Invalid JSON"
+
+    def test_body_parsed_regardless_of_content_type(self, client, tmp_path, monkeypatch):
+        """Like get_json(force=True): the body is parsed even without a JSON Content-Type."""
+        monkeypatch.setattr(server_module, "LOG_FILE", tmp_path / "test_log.jsonl")
+        r = client.post("/save", data=json.dumps(VALID_PAYLOAD), content_type="text/plain")
+        assert r.status_code == 200
+
     def test_error_message_includes_allowed_values(self, client, tmp_path, monkeypatch):
         """Error messages must include the set of allowed values (developer UX)."""
         monkeypatch.setattr(server_module, "LOG_FILE", tmp_path / "test_log.jsonl")
@@ -162,3 +191,127 @@ class TestApiAnalysesEndpoint:
         data = r.get_json()
         assert len(data) == 1
         assert data[0]["title"] == "Test article"
+
+    def test_skips_narrative_and_non_object_lines(self, client, tmp_path, monkeypatch):
+        log_file = tmp_path / "test_log.jsonl"
+        log_file.write_bytes(b'narrative\n\n[1, 2]\n{bad\n  {"title": "A"}\r\n{"title": "B"}\n')
+        monkeypatch.setattr(server_module, "LOG_FILE", log_file)
+        r = client.get("/api/analyses")
+        assert [o["title"] for o in r.get_json()] == ["A", "B"]
+
+
+# ── Conditional GET (ETag) ───────────────────────────────────────────────────
+
+class TestConditionalGet:
+    def test_static_response_has_weak_etag(self, client, tmp_path, monkeypatch):
+        tf = tmp_path / "themes.json"
+        tf.write_text(json.dumps({"active_themes": []}))
+        monkeypatch.setattr(server_module, "THEMES_FILE", tf)
+        r = client.get("/themes")
+        assert r.status_code == 200
+        assert r.headers["ETag"].startswith('W/"')
+        assert "no-store" not in r.headers["Cache-Control"]
+
+    def test_matching_if_none_match_returns_304(self, client, tmp_path, monkeypatch):
+        tf = tmp_path / "themes.json"
+        tf.write_text(json.dumps({"active_themes": []}))
+        monkeypatch.setattr(server_module, "THEMES_FILE", tf)
+        etag = client.get("/themes").headers["ETag"]
+        r = client.get("/themes", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.data == b""
+
+    def test_stale_etag_returns_full_body(self, client, tmp_path, monkeypatch):
+        tf = tmp_path / "themes.json"
+        tf.write_text(json.dumps({"active_themes": []}))
+        monkeypatch.setattr(server_module, "THEMES_FILE", tf)
+        r = client.get("/themes", headers={"If-None-Match": 'W/"stale"'})
+        assert r.status_code == 200
+        assert r.get_json() == {"active_themes": []}
+
+    def test_if_modified_since_returns_304(self, client, tmp_path, monkeypatch):
+        tf = tmp_path / "themes.json"
+        tf.write_text(json.dumps({"active_themes": []}))
+        monkeypatch.setattr(server_module, "THEMES_FILE", tf)
+        last_modified = client.get("/themes").headers["Last-Modified"]
+        r = client.get("/themes", headers={"If-Modified-Since": last_modified})
+        assert r.status_code == 304
+
+    def test_themes_reflects_file_edits(self, client, tmp_path, monkeypatch):
+        tf = tmp_path / "themes.json"
+        tf.write_text(json.dumps({"active_themes": [{"name": "A"}]}))
+        monkeypatch.setattr(server_module, "THEMES_FILE", tf)
+        assert client.get("/themes").get_json()["active_themes"][0]["name"] == "A"
+        tf.write_text(json.dumps({"active_themes": [{"name": "Bee"}]}))
+        assert client.get("/themes").get_json()["active_themes"][0]["name"] == "Bee"
+
+
+# ── Pre-compressed HTML ──────────────────────────────────────────────────────
+
+class TestPrecompressedHtml:
+    @pytest.fixture
+    def triage_pages(self, tmp_path, monkeypatch):
+        import gzip
+        body = b"<html>" + b"dashboard " * 200 + b"</html>"
+        page = tmp_path / "triage.html"
+        page.write_bytes(body)
+        (tmp_path / "triage.html.gz").write_bytes(gzip.compress(body))
+        monkeypatch.setattr(server_module, "TRIAGE_FILE", page)
+        return body
+
+    def test_serves_gzip_when_accepted(self, client, triage_pages):
+        import gzip
+        r = client.get("/", headers={"Accept-Encoding": "gzip, deflate"})
+        assert r.status_code == 200
+        assert r.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in r.headers["Vary"]
+        assert gzip.decompress(r.data) == triage_pages
+
+    def test_serves_plain_without_accept_encoding(self, client, triage_pages):
+        r = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert r.status_code == 200
+        assert "Content-Encoding" not in r.headers
+        assert r.data == triage_pages
+
+    def test_gzip_and_plain_have_distinct_etags(self, client, triage_pages):
+        gz_tag = client.get("/", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+        plain_tag = client.get("/", headers={"Accept-Encoding": "identity"}).headers["ETag"]
+        assert gz_tag != plain_tag
+
+
+# ── /api/analyses?limit= (offset index) ──────────────────────────────────────
+
+class TestApiAnalysesLimit:
+    def _save_n(self, client, n):
+        for i in range(n):
+            client.post("/save", json={**VALID_PAYLOAD, "title": f"T{i}"})
+
+    def test_limit_returns_most_recent_oldest_first(self, client, tmp_path, monkeypatch):
+        log_file = tmp_path / "test_log.jsonl"
+        monkeypatch.setattr(server_module, "LOG_FILE", log_file)
+        self._save_n(client, 5)
+        assert (tmp_path / "test_log.idx").stat().st_size == 5 * 8
+        data = client.get("/api/analyses?limit=2").get_json()
+        assert [d["title"] for d in data] == ["T3", "T4"]
+
+    def test_limit_larger_than_log(self, client, tmp_path, monkeypatch):
+        monkeypatch.setattr(server_module, "LOG_FILE", tmp_path / "test_log.jsonl")
+        self._save_n(client, 3)
+        data = client.get("/api/analyses?limit=50").get_json()
+        assert [d["title"] for d in data] == ["T0", "T1", "T2"]
+
+    def test_falls_back_when_log_edited_by_hand(self, client, tmp_path, monkeypatch):
+        log_file = tmp_path / "test_log.jsonl"
+        monkeypatch.setattr(server_module, "LOG_FILE", log_file)
+        self._save_n(client, 3)
+        with log_file.open("a") as f:
+            f.write(json.dumps({"title": "hand-added"}) + "\n")
+        data = client.get("/api/analyses?limit=2").get_json()
+        assert [d["title"] for d in data] == ["T2", "hand-added"]
+
+    def test_falls_back_without_index(self, client, tmp_path, monkeypatch):
+        log_file = tmp_path / "test_log.jsonl"
+        log_file.write_text("\n".join(json.dumps({"title": t}) for t in "ABC") + "\n")
+        monkeypatch.setattr(server_module, "LOG_FILE", log_file)
+        data = client.get("/api/analyses?limit=2").get_json()
+        assert [d["title"] for d in data] == ["B", "C"]
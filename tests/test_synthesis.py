@@ -1,11 +1,18 @@
 """Tests for synthesis helpers and JSONL loading."""
 import json
 import pytest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from src.synthesis import (
+    iter_analysis_objects,
+    iter_analysis_objects_reversed,
     load_analysis_objects,
+    parse_log_line,
     escape_html,
+    md_to_basic_html,
     parse_dt,
+    pick_event_time,
+    recent_analyses,
 )
 
 
@@ -55,6 +62,11 @@ class TestLoadAnalysisObjects:
         result = load_analysis_objects(log)
         assert len(result) == 2
 
+    def test_reads_indented_and_crlf_lines(self, tmp_path):
+        log = tmp_path / "analysis_log.jsonl"
+        log.write_bytes(b'  {"title": "A"}\r\n{"title": "B"}\r\n\t\r\n')
+        assert [o["title"] for o in load_analysis_objects(log)] == ["A", "B"]
+
     def test_skips_non_dict_json(self, tmp_path):
         """JSON arrays or primitives are not valid analysis entries."""
         log = tmp_path / "analysis_log.jsonl"
@@ -76,6 +88,69 @@ class TestLoadAnalysisObjects:
         result = load_analysis_objects(log)
         assert result == []
 
+    def test_iter_is_lazy(self, tmp_path):
+        log = tmp_path / "analysis_log.jsonl"
+        log.write_text(json.dumps({"title": "A"}) + "\n" + json.dumps({"title": "B"}) + "\n")
+        it = iter_analysis_objects(log)
+        assert next(it)["title"] == "A"
+        assert [o["title"] for o in it] == ["B"]
+
+
+class TestParseLogLine:
+    def test_objects_only(self):
+        assert parse_log_line(b'{"title": "A"}\n') == {"title": "A"}
+        assert parse_log_line(b'  {"title": "A"}\r\n') == {"title": "A"}
+        for line in (b"", b"\n", b"narrative text\n", b"[1, 2]\n", b"{not json\n"):
+            assert parse_log_line(line) is None
+
+
+class TestIterAnalysisObjectsReversed:
+    def test_newest_first_across_chunk_boundaries(self, tmp_path):
+        log = tmp_path / "analysis_log.jsonl"
+        titles = [f"entry-{i}" for i in range(20)]
+        log.write_text(
+            "narrative line\n\n"
+            + "".join(json.dumps({"title": t}) + "\n" for t in titles)
+        )
+        for chunk_size in (7, 64, 1 << 16):
+            result = [o["title"] for o in iter_analysis_objects_reversed(log, chunk_size)]
+            assert result == titles[::-1]
+
+    def test_last_line_without_newline(self, tmp_path):
+        log = tmp_path / "analysis_log.jsonl"
+        log.write_text(json.dumps({"title": "A"}) + "\n" + json.dumps({"title": "B"}))
+        assert [o["title"] for o in iter_analysis_objects_reversed(log, 5)] == ["B", "A"]
+
+    def test_missing_file(self, tmp_path):
+        assert list(iter_analysis_objects_reversed(tmp_path / "nope.jsonl")) == []
+
+
+class TestRecentAnalyses:
+    def test_early_stop_matches_full_scan(self, tmp_path):
+        now = datetime(2026, 1, 30, 12, tzinfo=timezone.utc)
+        since = now - timedelta(days=7)
+        iso = lambda days: (now - timedelta(days=days)).isoformat()
+        entries = [
+            # Out of window, received long ago
+            {"title": "old-1", "created_at": iso(40), "server_received_at": iso(40)},
+            {"title": "old-2", "published_at": iso(30), "server_received_at": iso(30)},
+            # Client clock far ahead: event time in window, received before the slack
+            {"title": "skewed", "created_at": iso(2), "server_received_at": iso(10)},
+            # In window
+            {"title": "new-1", "published_at": iso(6), "server_received_at": iso(5)},
+            {"title": "legacy", "created_at": iso(4)},
+            {"title": "new-2", "created_at": iso(1), "server_received_at": iso(1)},
+            {"title": "new-3", "published_at": iso(6), "server_received_at": iso(0.5)},
+        ]
+        log = tmp_path / "analysis_log.jsonl"
+        log.write_text("narrative\n" + "".join(json.dumps(e) + "\n" for e in entries))
+
+        full = [(pick_event_time(a), a) for a in load_analysis_objects(log)]
+        expected = sorted(((dt, a) for dt, a in full if dt and dt >= since), key=lambda x: x[0])
+        result = recent_analyses(log, since)
+        assert result == expected
+        assert [a["title"] for _, a in result] == ["new-1", "new-3", "legacy", "skewed", "new-2"]
+
 
 # ── escape_html ────────────────────────────────────────────
 
@@ -91,6 +166,21 @@ class TestEscapeHtml:
         assert escape_html("") == ""
         assert escape_html(None) == ""
 
+    def test_matches_stdlib_html_escape(self):
+        import html
+        s = """<a href="x">Tom's & Jerry's</a>"""
+        assert escape_html(s) == html.escape(s)
+
+
+# ── md_to_basic_html ───────────────────────────────────────
+
+class TestMdToBasicHtml:
+    def test_structure_and_escaping(self):
+        out = md_to_basic_html("# Memo <b>\n- AT&T\nplain 'text'\n")
+        assert "<h1>Memo &lt;b&gt;</h1>" in out
+        assert "<ul><li>AT&amp;T</li></ul>" in out
+        assert "<p>plain &#x27;text&#x27;</p>" in out
+
 
 # ── parse_dt ───────────────────────────────────────────────
 
@@ -110,3 +200,11 @@ class TestParseDt:
 
     def test_invalid(self):
         assert parse_dt("not-a-date") is None
+
+    def test_naive_assumed_utc(self):
+        dt = parse_dt("2025-01-30T12:00:00")
+        assert dt is not None and dt.utcoffset().total_seconds() == 0
+
+    def test_non_string(self):
+        assert parse_dt(12345) is None
+        assert parse_dt(["2025-01-30"]) is None
@@ -9,6 +9,10 @@ from src.triage import (
     confidence,
     strip_html,
     make_triage_decision,
+    parse_dt,
+    parse_rss_published_iso,
+    is_recent,
+    build_schema,
     SCORE_BASELINE,
     HIGH_THRESHOLD,
     MEDIUM_THRESHOLD,
@@ -109,6 +113,13 @@ class TestScoreItem:
         score_keyword, _, _ = score_item(title, "HBM affected by grid constraint news",       "WSJ", theme_triggers=themes_keyword)
         assert score_phrase > score_keyword
 
+    def test_prepared_themes_match_raw_themes(self):
+        from src.triage import prepare_themes
+        themes = [{"name": "AI infra", "watch_triggers": ["HBM Allocation"], "keywords_any": ["HBM", "Interconnect"]}]
+        for title in ("hbm allocation tightens", "HBM and interconnect news", "Weather"):
+            assert score_item(title, "", "WSJ", theme_triggers=prepare_themes(themes)) == \
+                score_item(title, "", "WSJ", theme_triggers=themes)
+
     def test_no_theme_match(self):
         themes = [{"name": "AI infra", "watch_triggers": ["HBM allocation"], "keywords_any": ["HBM", "interconnect"]}]
         score, _, matched = score_item("Weather forecast sunny", "", "WSJ", theme_triggers=themes)
@@ -146,10 +157,23 @@ class TestClassifyCategory:
         assert len(cats) >= 2
         assert cats[0] == "Policy/Regulatory"
 
+    def test_shared_keyword_hits_every_category(self):
+        # "copper" is in both the Markets and Structural rules
+        assert classify_categories("Copper", "") == ["Markets", "Structural"]
+
     def test_single_category_returns_list(self):
         cats = classify_categories("Weather forecast for weekend", "")
         assert cats == ["Cyclical"]
 
+    def test_build_schema_reuses_ingestion_categories(self):
+        item = {"title": "Fed tariff on semiconductor imports", "summary": "", "source": "WSJ",
+                "link": "https://example.com/a", "published_at": ""}
+        fresh = build_schema(item)
+        assert fresh["category"] == "Policy/Regulatory"
+        carried = build_schema({**item, "categories": ["Structural"]})
+        assert carried["category"] == "Structural"
+        assert carried["secondary_categories"] == []
+
 
 # ── signal_strength ────────────────────────────────────────
 
@@ -191,6 +215,12 @@ class TestTimeHorizon:
         # Structural language in an Earnings article → Structural via text cue
         assert time_horizon("Earnings", "This represents a multi-year secular shift") == "Structural"
 
+    def test_overlapping_cue_counts_for_both_rules(self):
+        # "Q3 results" is an immediate cue and also contains a numeric token
+        assert time_horizon("Cyclical", "Q3 results") == "Immediate"
+        score, reasons, _ = score_item("Q3 results", "", "WSJ")
+        assert any("quantitative" in r.lower() for r in reasons)
+
     def test_no_text_cue_uses_category(self):
         assert time_horizon("Geopolitics", "Russia and Ukraine diplomatic talks") == "Near-term"
 
@@ -233,9 +263,204 @@ class TestStripHtml:
     def test_handles_empty(self):
         assert strip_html("") == ""
 
+    def test_removes_tag_spanning_lines(self):
+        assert strip_html('<a\nhref="x">link</a>') == "link"
+
     def test_decodes_html_entities(self):
         assert strip_html("AT&amp;T raises &lt;5%&gt; guidance") == "AT&T raises <5%> guidance"
 
     def test_decodes_nbsp(self):
         result = strip_html("word&nbsp;word")
         assert "\xa0" in result or "word" in result  # decoded non-breaking space
+
+
+# ── timestamp parsing ──────────────────────────────────────
+
+class TestParseDt:
+    def test_iso_with_offset(self):
+        assert parse_dt("2026-01-19T18:26:54.673676+00:00").isoformat() == "2026-01-19T18:26:54.673676+00:00"
+
+    def test_iso_z_suffix(self):
+        assert parse_dt("2026-01-19T18:26:54Z").isoformat() == "2026-01-19T18:26:54+00:00"
+
+    def test_rfc822_pubdate(self):
+        assert parse_dt("Mon, 19 Jan 2026 18:26:54 -0500").isoformat() == "2026-01-19T18:26:54-05:00"
+
+    def test_naive_assumed_utc(self):
+        assert parse_dt("2026-01-19 18:26").tzinfo is not None
+
+    def test_invalid_and_empty(self):
+        assert parse_dt("not a date at all") is None
+        assert parse_dt("") is None
+        assert parse_dt(None) is None
+
+    def test_rss_entry_falls_back_to_struct_time(self):
+        entry = {"published": "garbage", "published_parsed": (2026, 1, 19, 18, 26, 54, 0, 19, 0)}
+        assert parse_rss_published_iso(entry) == "2026-01-19T18:26:54+00:00"
+
+    def test_rss_entry_prefers_struct_time_in_utc(self):
+        import feedparser
+        feed = feedparser.parse(
+            "<rss version='2.0'><channel><item><title>x</title>"
+            "<pubDate>Mon, 19 Jan 2026 18:26:54 -0500</pubDate></item></channel></rss>"
+        )
+        assert parse_rss_published_iso(feed.entries[0]) == "2026-01-19T23:26:54+00:00"
+        assert parse_rss_published_iso({"published": "2026-01-19T18:26:54Z"}) == "2026-01-19T18:26:54+00:00"
+
+    def test_rss_string_fallback_normalizes_offset_to_utc(self):
+        entry = {"published": "Mon, 19 Jan 2026 18:26:54 -0500"}
+        assert parse_rss_published_iso(entry) == "2026-01-19T23:26:54+00:00"
+
+    def test_is_recent(self):
+        assert is_recent("2000-01-01T00:00:00Z", hours=48) is False
+        assert is_recent("", hours=48) is False
+
+    def test_is_recent_with_precomputed_cutoffs(self):
+        from datetime import datetime, timezone
+        from src.triage import recency_cutoffs, CATEGORY_WINDOW_HOURS
+        now = datetime(2026, 1, 20, 12, tzinfo=timezone.utc)
+        cutoffs = recency_cutoffs(now)
+        assert set(CATEGORY_WINDOW_HOURS.values()) <= set(cutoffs)
+        assert is_recent("2026-01-19T13:00:00Z", hours=48, cutoffs=cutoffs) is True
+        assert is_recent("2026-01-18T11:00:00Z", hours=48, cutoffs=cutoffs) is False
+        assert is_recent("2026-01-10T00:00:00Z", hours=336, cutoffs=cutoffs) is True
+
+    def test_url_age_days_and_evergreen(self):
+        from datetime import datetime, timedelta, timezone
+        from src.triage import url_age_days, evergreen_badge, EVERGREEN_DAYS
+        old = (datetime.now(timezone.utc) - timedelta(days=EVERGREEN_DAYS + 1, hours=1)).isoformat()
+        assert url_age_days(old) == EVERGREEN_DAYS + 1
+        assert evergreen_badge(old) == (True, EVERGREEN_DAYS + 1)
+        assert url_age_days(datetime.now(timezone.utc).isoformat()) == 0
+        assert evergreen_badge("") == (False, None)
+        assert url_age_days(5) is None
+        assert url_age_days(["x"]) is None
+        assert evergreen_badge(5) == (False, None)
+
+    def test_url_age_days_exact_at_day_boundary(self):
+        from datetime import datetime, timedelta, timezone
+        from src.triage import url_age_days
+        now = datetime(2026, 1, 20, 12, 0, 30, tzinfo=timezone.utc)
+        assert url_age_days((now - timedelta(days=3)).isoformat(), now) == 3
+        assert url_age_days((now - timedelta(days=3, seconds=-1)).isoformat(), now) == 2
+
+    def test_prune_url_first_seen_matches_age_rule(self):
+        from datetime import datetime, timedelta, timezone
+        from src.triage import prune_url_first_seen, url_age_days, URL_PRUNE_DAYS
+        now = datetime.now(timezone.utc)
+        store = {}
+        for i, days in enumerate((0, 30, URL_PRUNE_DAYS - 1, URL_PRUNE_DAYS + 0.5, URL_PRUNE_DAYS + 2, 400)):
+            ts = now - timedelta(days=days, minutes=1)
+            store[f"iso{i}"] = ts.isoformat()
+            store[f"z{i}"] = ts.strftime("%Y-%m-%dT%H:%M:%SZ")  # non-canonical → parsed path
+        store["bad"] = "not a date"
+        store["int"] = 5
+        store["list"] = ["x"]
+        expected = {u for u, ts in store.items() if not ((url_age_days(ts) or 0) > URL_PRUNE_DAYS)}
+        assert prune_url_first_seen(store) == 4
+        assert set(store) == expected
+        assert "bad" in store and "iso3" in store and "iso4" not in store
+        assert store["int"] == 5 and store["list"] == ["x"]
+
+
+# ── fetch_all_feeds ────────────────────────────────────────
+
+class TestFetchAllFeeds:
+    def test_preserves_order_and_failures(self, monkeypatch):
+        import src.triage as triage_module
+        monkeypatch.setattr(triage_module, "fetch_feed", lambda u: None if u == "b" else u.upper())
+        result = triage_module.fetch_all_feeds(["a", "b", "c"])
+        assert list(result) == ["a", "b", "c"]
+        assert result == {"a": "A", "b": None, "c": "C"}
+
+    def test_empty(self):
+        import src.triage as triage_module
+        assert triage_module.fetch_all_feeds([]) == {}
+
+
+class TestConditionalFetch:
+    RSS = (b"<?xml version='1.0'?><rss version='2.0'><channel><title>T</title>"
+           b"<item><title>Hello</title><link>https://x/1</link></item></channel></rss>")
+
+    def test_replays_cached_body_on_304(self, monkeypatch, tmp_path):
+        import io
+        import urllib.error
+        import src.triage as triage_module
+
+        seen_headers = []
+
+        class Resp(io.BytesIO):
+            headers = {"ETag": '"v1"'}
+
+        class Opener:
+            def open(self, req, timeout=None):
+                seen_headers.append(dict(req.header_items()))
+                if "If-none-match" in req.headers:
+                    raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+                return Resp(TestConditionalFetch.RSS)
+
+        monkeypatch.setattr(triage_module, "_FEED_OPENER", Opener())
+        monkeypatch.setattr(triage_module, "FEED_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(triage_module, "FEED_VALIDATORS", {})
+
+        first = triage_module.fetch_feed("https://feed")
+        assert triage_module.FEED_VALIDATORS["https://feed"] == {"etag": '"v1"'}
+        second = triage_module.fetch_feed("https://feed")
+
+        assert "If-none-match" not in seen_headers[0]
+        assert seen_headers[1]["If-none-match"] == '"v1"'
+        assert [e.title for e in second.entries] == [e.title for e in first.entries] == ["Hello"]
+
+    def test_no_validators_sent_without_cached_body(self, monkeypatch, tmp_path):
+        import io
+        import src.triage as triage_module
+
+        seen_headers = []
+
+        class Opener:
+            def open(self, req, timeout=None):
+                seen_headers.append(dict(req.header_items()))
+                resp = io.BytesIO(TestConditionalFetch.RSS)
+                resp.headers = {}
+                return resp
+
+        monkeypatch.setattr(triage_module, "_FEED_OPENER", Opener())
+        monkeypatch.setattr(triage_module, "FEED_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(triage_module, "FEED_VALIDATORS", {"https://feed": {"etag": '"stale"'}})
+
+        assert triage_module.fetch_feed("https://feed").entries[0].title == "Hello"
+        assert "If-none-match" not in seen_headers[0]
+        assert "https://feed" not in triage_module.FEED_VALIDATORS
+
+
+# ── dashboard_json_bytes ───────────────────────────────────
+
+class TestDashboardJson:
+    def test_round_trips_and_cannot_close_script(self):
+        import json
+        from src.triage import dashboard_json_bytes
+        items = [{"title": "Café </script><script>alert(1)</script>", "raw_score": 62}]
+        out = dashboard_json_bytes(items)
+        assert b"<" not in out
+        assert json.loads(out) == items
+
+
+# ── load_json / save_json ──────────────────────────────────
+
+class TestJsonIO:
+    def test_round_trip_matches_stdlib_layout(self, tmp_path):
+        import json
+        from src.triage import load_json, save_json
+        obj = {"last_run_at": "2026-01-30T22:52:53+00:00", "last_run_urls": ["https://x/é"]}
+        path = tmp_path / "state.json"
+        save_json(path, obj)
+        assert path.read_text(encoding="utf-8") == json.dumps(obj, indent=2, ensure_ascii=False)
+        assert load_json(path, None) == obj
+        assert not path.with_suffix(".tmp").exists()
+
+    def test_load_returns_default_on_missing_or_invalid(self, tmp_path):
+        from src.triage import load_json
+        assert load_json(tmp_path / "missing.json", {"d": 1}) == {"d": 1}
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        assert load_json(bad, []) == []